@@ -3,9 +3,11 @@
 import os
 from typing import List, Dict, Any, Optional
 from ipaddress import ip_address
-from pydantic import Field, validator
+from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from functools import lru_cache
+
+MIN_PROFILE_KEY_LENGTH = 32
+MAX_PROFILE_KEY_LENGTH = 512
 
 
 class Settings(BaseSettings):
@@ -25,6 +27,10 @@ class Settings(BaseSettings):
     port: int = Field(default=17777)
     debug: bool = Field(default=False)
     log_level: str = Field(default="INFO")
+    # Log 1 in N fast successful requests; errors and slow requests always log.
+    request_log_sample_rate: int = Field(default=1, ge=1)
+    # Run new tasks eagerly until their first await (Python 3.12+ only).
+    eager_tasks: bool = Field(default=False)
 
     # Security Configuration
     secret_key: str = Field(default="your-secret-key-change-this")
@@ -35,6 +41,9 @@ class Settings(BaseSettings):
     finance_key: Optional[str] = Field(default=None, repr=False)
     ops_key: Optional[str] = Field(default=None, repr=False)
     keyless_web_enabled: bool = Field(default=False)
+    # Verified bearer keys are memoized per process; 0 entries disables it.
+    auth_cache_max_entries: int = Field(default=1024, ge=0)
+    auth_cache_ttl_seconds: int = Field(default=300, ge=0)
     # Readiness js_predicate runs caller-supplied JavaScript in the page
     # context, which can exfiltrate whatever the session's cookies can reach.
     # Off by default; enable only for trusted callers.
@@ -223,7 +232,8 @@ class Settings(BaseSettings):
     mouse_movement_reaction_delay_min: float = Field(default=0.1)
     mouse_movement_reaction_delay_max: float = Field(default=0.3)
 
-    @validator("browse_key", "ui_key", "finance_key", "ops_key", pre=True)
+    @field_validator("browse_key", "ui_key", "finance_key", "ops_key", mode="before")
+    @classmethod
     def normalize_profile_key(cls, value: Any) -> Optional[str]:
         """Treat blank optional profile-key settings as disabled profiles."""
         if isinstance(value, str):
@@ -231,7 +241,8 @@ class Settings(BaseSettings):
             return value or None
         return value
 
-    @validator("log_level")
+    @field_validator("log_level")
+    @classmethod
     def validate_log_level(cls, v: str) -> str:
         """Validate log level"""
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -263,9 +274,16 @@ class Settings(BaseSettings):
             for name, value in self.profile_keys().items()
             if value is not None
         }
-        short = [name for name, value in configured.items() if len(value) < 32]
+        short = [name for name, value in configured.items() if len(value) < MIN_PROFILE_KEY_LENGTH]
         if short:
-            raise ValueError(f"SURF profile keys must be at least 32 characters: {', '.join(short)}")
+            raise ValueError(
+                f"SURF profile keys must be at least {MIN_PROFILE_KEY_LENGTH} characters: {', '.join(short)}"
+            )
+        oversized = [name for name, value in configured.items() if len(value) > MAX_PROFILE_KEY_LENGTH]
+        if oversized:
+            raise ValueError(
+                f"SURF profile keys must be at most {MAX_PROFILE_KEY_LENGTH} characters: {', '.join(oversized)}"
+            )
         values = list(configured.values())
         if len(values) != len(set(values)):
             raise ValueError("SURF profile keys must be distinct")
@@ -283,61 +301,36 @@ class Settings(BaseSettings):
     def allows_keyless_web(self) -> bool:
         return self.is_loopback_host() or self.keyless_web_enabled
 
-    @validator("block_resources", pre=True)
-    def parse_block_resources(cls, v: Any) -> List[str]:
-        """Parse block resources from string or list"""
-        if isinstance(v, str):
-            return [item.strip() for item in v.split(",") if item.strip()]
-        return v
-
-    @validator("adblock_filter_urls", pre=True)
-    def parse_adblock_filter_urls(cls, v: Any) -> List[str]:
-        """Parse adblock filter URLs from string or list"""
+    @field_validator("block_resources", "adblock_filter_urls", "export_roots", mode="before")
+    @classmethod
+    def parse_csv_list(cls, v: Any) -> List[str]:
+        """Parse a comma-separated value, dropping blank items"""
         if isinstance(v, str):
             return [item.strip() for item in v.split(",") if item.strip()]
         return v
 
-    @validator("cors_origins", pre=True)
-    def parse_cors_origins(cls, v: Any) -> List[str]:
-        """Parse CORS origins from string or list"""
+    @field_validator("cors_origins", "cors_methods", "cors_headers", mode="before")
+    @classmethod
+    def parse_cors_list(cls, v: Any) -> List[str]:
+        """Parse CORS settings from string or list"""
         if isinstance(v, str):
             return [item.strip() for item in v.split(",")]
         return v
 
-    @validator("cors_methods", pre=True)
-    def parse_cors_methods(cls, v: Any) -> List[str]:
-        """Parse CORS methods from string or list"""
-        if isinstance(v, str):
-            return [item.strip() for item in v.split(",")]
-        return v
-
-    @validator("cors_headers", pre=True)
-    def parse_cors_headers(cls, v: Any) -> List[str]:
-        """Parse CORS headers from string or list"""
-        if isinstance(v, str):
-            return [item.strip() for item in v.split(",")]
-        return v
-
-    @validator("outbound_allowed_hosts", pre=True)
+    @field_validator("outbound_allowed_hosts", mode="before")
+    @classmethod
     def parse_outbound_allowed_hosts(cls, v: Any) -> List[str]:
         """Parse exact or wildcard host exceptions from a comma-separated value."""
         if isinstance(v, str):
             return [item.strip().lower().rstrip(".") for item in v.split(",") if item.strip()]
         return v
 
-    @validator("export_roots", pre=True)
-    def parse_export_roots(cls, v: Any) -> List[str]:
-        """Parse explicitly writable artifact roots from a comma-separated value."""
-        if isinstance(v, str):
-            return [item.strip() for item in v.split(",") if item.strip()]
-        return v
-
 
-@lru_cache()
-def get_settings() -> Settings:
-    """Get cached settings instance"""
-    return Settings()
+# Global settings instance, built once at import so get_settings() is a plain
+# global read rather than an lru_cache lookup on every call.
+settings = Settings()
 
 
-# Global settings instance
-settings = get_settings()
+def get_settings() -> Settings:
+    """Get the shared settings instance"""
+    return settings
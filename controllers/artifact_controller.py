@@ -27,6 +27,9 @@ async def get_artifact_content(
             path=artifact_service.path_for(artifact_id),
             filename=record["filename"],
             media_type=record.get("content_type") or "application/octet-stream",
+            # Artifact ids are never reused, so clients may reuse the bytes
+            # briefly instead of re-fetching them on every render.
+            headers={"Cache-Control": "private, max-age=60"},
         )
     except Exception:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Artifact not found")
@@ -28,7 +28,7 @@ async def browse(
             url=str(request.url),
             mode=request.mode,
             content_mode=request.content_mode,
-            readiness=request.readiness.dict() if request.readiness else None,
+            readiness=request.readiness.model_dump() if request.readiness else None,
             include_screenshot=request.include_screenshot,
             keep_session=request.keep_session,
             extract_download=request.extract_download,
@@ -3,6 +3,7 @@ from typing import Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status
 import structlog
 
+from config.settings import get_settings
 from core.foundation import get_current_user, get_browser_service, get_session_service
 from core.foundation import BrowserOperationError, SessionNotFoundError, SessionBusyError, ValidationError
 from services.outbound_policy import OutboundPolicyError
@@ -14,7 +15,7 @@ from models.schemas import (
     DownloadClickRequest, DownloadResponse,
     StructuredDataRequest, StructuredDataResponse,
     CaptchaDetectionRequest, CaptchaDetectionResponse,
-    BatchRequest, BatchOperationResponse, ExtractType, InteractionAction,
+    BatchRequest, BatchOperationResponse, ExtractType, InteractionAction, WaitUntil,
     ScrollRequest, ScrollResponse,
     KeyPressRequest, ConsoleCaptureRequest, ViewportResizeRequest,
 )
@@ -23,6 +24,7 @@ from services.session_service import SessionService
 
 logger = structlog.get_logger()
 router = APIRouter()
+settings = get_settings()
 
 
 async def _active_page_operation(request, operation, method, browser_service, session_service):
@@ -33,7 +35,7 @@ async def _active_page_operation(request, operation, method, browser_service, se
     except SessionNotFoundError as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
     except Exception as e:
-        logger.error(f"{operation} failed", error=str(e), session_id=request.session_id)
+        logger.error("Page operation failed", operation=operation, error=str(e), session_id=request.session_id)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail=f"{operation} failed")
 
 
@@ -69,7 +71,7 @@ async def navigate(
                 url=str(request.url),
                 wait_until=request.wait_until,
                 timeout=request.timeout,
-                readiness=request.dict().get("readiness"),
+                readiness=request.readiness.model_dump() if request.readiness else None,
             )
             result["blocker_delta"] = session_service.finish_navigation_snapshot(session)
 
@@ -97,7 +99,7 @@ async def navigate(
             detail=str(e)
         )
     except BrowserOperationError as e:
-        logger.error("Navigation failed", error=str(e), error_code=e.error_code, details=e.details, session_id=request.session_id, exc_info=True)
+        logger.error("Navigation failed", error=str(e), error_code=e.error_code, details=e.details, session_id=request.session_id, exc_info=settings.debug)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Navigation failed: {e.message}"
@@ -147,7 +149,7 @@ async def extract_content(
             detail=str(e)
         )
     except BrowserOperationError as e:
-        logger.error("Content extraction failed", error=str(e), error_code=e.error_code, details=e.details, session_id=request.session_id, exc_info=True)
+        logger.error("Content extraction failed", error=str(e), error_code=e.error_code, details=e.details, session_id=request.session_id, exc_info=settings.debug)
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Content extraction failed: {e.message}"
@@ -266,6 +268,7 @@ async def take_screenshot(
                 full_page=request.full_page,
                 path=request.path,
                 quality=request.quality,
+                image_format=request.format,
                 timeout=request.timeout
             )
         
@@ -466,6 +469,11 @@ async def batch_operations(
             results = await _execute_sequential_operations(
                 request.operations, session, browser_service
             )
+
+        # One stats update for the whole batch rather than one per operation
+        await session_service.update_session_stats_bulk(
+            request.session_id, _batch_stats_updates(results)
+        )
         
         successful_operations = sum(1 for r in results if r.get("success", False))
         
@@ -587,64 +595,88 @@ async def detect_captcha(
 
 
 # Helper functions for batch operations
+def _batch_navigate(browser_service, session, operation: dict):
+    wait_until = operation.get("wait_until", "domcontentloaded")
+    if isinstance(wait_until, str):
+        wait_until = WaitUntil(wait_until)
+    return browser_service.navigate_to_url(
+        session=session,
+        url=operation["url"],
+        wait_until=wait_until,
+        timeout=operation.get("timeout")
+    )
+
+
+def _batch_extract(browser_service, session, operation: dict):
+    return browser_service.extract_content(
+        session=session,
+        extract_type=ExtractType(operation.get("extract_type", "text")),
+        selector=operation.get("selector"),
+        timeout=operation.get("timeout")
+    )
+
+
+def _batch_extract_structured(browser_service, session, operation: dict):
+    return browser_service.extract_structured_data(
+        session=session,
+        content_type=operation.get("content_type", "general"),
+        selector=operation.get("selector"),
+        timeout=operation.get("timeout")
+    )
+
+
+def _batch_detect_captcha(browser_service, session, operation: dict):
+    return browser_service.detect_captcha(
+        session=session,
+        selector=operation.get("selector"),
+        timeout=operation.get("timeout")
+    )
+
+
+def _batch_interact(browser_service, session, operation: dict):
+    return browser_service.interact_with_element(
+        session=session,
+        action=InteractionAction(operation["action"]),
+        selector=operation["selector"],
+        value=operation.get("value"),
+        options=operation.get("options"),
+        timeout=operation.get("timeout")
+    )
+
+
+def _batch_screenshot(browser_service, session, operation: dict):
+    return browser_service.take_screenshot(
+        session=session,
+        selector=operation.get("selector"),
+        full_page=operation.get("full_page", False),
+        path=operation.get("path"),
+        quality=operation.get("quality"),
+        image_format=operation.get("format"),
+        timeout=operation.get("timeout")
+    )
+
+
+# Batch operation type -> handler returning the browser_service awaitable
+_BATCH_HANDLERS = {
+    "navigate": _batch_navigate,
+    "extract": _batch_extract,
+    "extract_structured": _batch_extract_structured,
+    "detect_captcha": _batch_detect_captcha,
+    "interact": _batch_interact,
+    "screenshot": _batch_screenshot,
+}
+
+
 async def _execute_operation(operation: dict, session, browser_service) -> dict:
     """Execute a single operation"""
     try:
         op_type = operation.get("type")
+        handler = _BATCH_HANDLERS.get(op_type)
         
-        if op_type == "navigate":
-            wait_until = operation.get("wait_until", "domcontentloaded")
-            if isinstance(wait_until, str):
-                from models.schemas import WaitUntil
-                wait_until = WaitUntil(wait_until)
-            result = await browser_service.navigate_to_url(
-                session=session,
-                url=operation["url"],
-                wait_until=wait_until,
-                timeout=operation.get("timeout")
-            )
-        elif op_type == "extract":
-            extract_type = ExtractType(operation.get("extract_type", "text"))
-            result = await browser_service.extract_content(
-                session=session,
-                extract_type=extract_type,
-                selector=operation.get("selector"),
-                timeout=operation.get("timeout")
-            )
-        elif op_type == "extract_structured":
-            result = await browser_service.extract_structured_data(
-                session=session,
-                content_type=operation.get("content_type", "general"),
-                selector=operation.get("selector"),
-                timeout=operation.get("timeout")
-            )
-        elif op_type == "detect_captcha":
-            result = await browser_service.detect_captcha(
-                session=session,
-                selector=operation.get("selector"),
-                timeout=operation.get("timeout")
-            )
-        elif op_type == "interact":
-            action = InteractionAction(operation["action"])
-            result = await browser_service.interact_with_element(
-                session=session,
-                action=action,
-                selector=operation["selector"],
-                value=operation.get("value"),
-                options=operation.get("options"),
-                timeout=operation.get("timeout")
-            )
-        elif op_type == "screenshot":
-            result = await browser_service.take_screenshot(
-                session=session,
-                selector=operation.get("selector"),
-                full_page=operation.get("full_page", False),
-                path=operation.get("path"),
-                quality=operation.get("quality"),
-                timeout=operation.get("timeout")
-            )
-        else:
+        if handler is None:
             result = {"error": f"Unknown operation type: {op_type}"}
+        else:
+            result = await handler(browser_service, session, operation)
         
         return {
             "operation": op_type,
@@ -660,6 +692,19 @@ async def _execute_operation(operation: dict, session, browser_service) -> dict:
         }
 
 
+def _batch_stats_updates(results: list) -> list:
+    """Build session stat updates for the successful operations of a batch"""
+    updates = []
+    for result in results:
+        if not result.get("success"):
+            continue
+        update = {"operation": result["operation"]}
+        if result["operation"] == "navigate":
+            update["duration"] = result["data"].get("duration_ms", 0) / 1000
+        updates.append(update)
+    return updates
+
+
 async def _execute_parallel_operations(operations: list, session, browser_service, max_concurrent: int) -> list:
     """Execute operations in parallel with concurrency control"""
     import asyncio
@@ -16,7 +16,7 @@ router = APIRouter()
 async def list_downloads(
     download_service: DownloadService = Depends(get_download_service),
     user: Dict[str, Any] = Depends(get_current_user)
-):
+) -> Dict[str, Any]:
     """List sandboxed downloads."""
     return {"success": True, "downloads": download_service.list_downloads()}
 
@@ -26,7 +26,7 @@ async def get_download(
     download_id: str,
     download_service: DownloadService = Depends(get_download_service),
     user: Dict[str, Any] = Depends(get_current_user)
-):
+) -> Dict[str, Any]:
     """Return download metadata."""
     try:
         return {"success": True, "download": download_service.get_download(download_id)}
@@ -57,7 +57,7 @@ async def delete_download(
     download_id: str,
     download_service: DownloadService = Depends(get_download_service),
     user: Dict[str, Any] = Depends(get_current_user)
-):
+) -> Dict[str, Any]:
     """Delete a sandboxed download."""
     try:
         return {"success": True, "data": download_service.delete_download(download_id)}
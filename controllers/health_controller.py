@@ -1,7 +1,7 @@
 """Health check controller for Surf Browser Service"""
 import psutil
 import time
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
 from fastapi import APIRouter, Depends, Response, status
 import structlog
 
@@ -23,10 +23,32 @@ settings = get_settings()
 # Track service start time
 _start_time = time.time()
 
+# Logical CPU count cannot change for the life of the process.
+_CPU_COUNT = psutil.cpu_count()
+
+# One Process handle so cpu_percent() measures since the previous scrape;
+# a fresh handle has no baseline and always reports 0.0.
+_PROCESS = psutil.Process()
+
+# Disk usage moves slowly; refresh it at most every 30 seconds.
+_DISK_TTL_SECONDS = 30.0
+_disk_cache: Optional[Tuple[float, Any]] = None
+
+# Scrapers and sidecars polling within the same second share one snapshot.
+_METRICS_TTL_SECONDS = 1.0
+_metrics_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+
+
+def _disk_usage(now: float):
+    global _disk_cache
+    if _disk_cache is None or _disk_cache[0] <= now:
+        _disk_cache = (now + _DISK_TTL_SECONDS, psutil.disk_usage('/'))
+    return _disk_cache[1]
+
 
 def _process_memory_tree() -> Dict[str, Any]:
     try:
-        process = psutil.Process()
+        process = _PROCESS
         children = process.children(recursive=True)
         process_memory = process.memory_info()
         child_rss = 0
@@ -112,7 +134,7 @@ async def health_check(
 async def readiness_check(
     response: Response,
     _user: Dict[str, Any] = Depends(require_full_access),
-):
+) -> Dict[str, Any]:
     """Readiness check for load balancers"""
     
     try:
@@ -141,7 +163,7 @@ async def readiness_check(
 
 
 @router.get("/live")
-async def liveness_check():
+async def liveness_check() -> Dict[str, Any]:
     """Liveness check for container orchestration"""
     
     try:
@@ -157,14 +179,20 @@ async def liveness_check():
 async def get_metrics(
     response: Response,
     _user: Dict[str, Any] = Depends(require_full_access),
-):
+) -> Dict[str, Any]:
     """Get detailed service metrics for monitoring"""
     
+    global _metrics_cache
+
     try:
+        now = time.monotonic()
+        if _metrics_cache is not None and _metrics_cache[0] > now:
+            return {"success": True, "metrics": _metrics_cache[1]}
+
         # System metrics
         memory_info = psutil.virtual_memory()
         cpu_usage = psutil.cpu_percent(interval=None)
-        disk_usage = psutil.disk_usage('/')
+        disk_usage = _disk_usage(now)
         
         # Service metrics
         uptime = time.time() - _start_time
@@ -183,7 +211,7 @@ async def get_metrics(
                 },
                 "cpu": {
                     "usage_percent": cpu_usage,
-                    "count": psutil.cpu_count()
+                    "count": _CPU_COUNT
                 },
                 "disk": {
                     "total": disk_usage.total,
@@ -204,12 +232,13 @@ async def get_metrics(
                 "child_count": process_memory["child_count"],
                 "child_memory_rss": process_memory["child_rss"],
                 "tree_memory_rss": process_memory["tree_rss"],
-                "cpu_percent": psutil.Process().cpu_percent(),
+                "cpu_percent": _PROCESS.cpu_percent(),
                 "num_threads": process_memory["num_threads"],
                 "create_time": process_memory["create_time"]
             }
         }
         
+        _metrics_cache = (now + _METRICS_TTL_SECONDS, metrics)
         return {"success": True, "metrics": metrics}
         
     except Exception as e:
@@ -222,7 +251,7 @@ async def get_metrics(
 async def searxng_health(
     response: Response,
     _user: Dict[str, Any] = Depends(require_full_access),
-):
+) -> Dict[str, Any]:
     """Probe SearXNG reachability without mutating runtime state."""
     probe = await probe_searxng()
     result = {"status": "ready" if probe.get("reachable") else "down", "probe": probe}
@@ -235,7 +264,7 @@ async def searxng_health(
 async def searxng_autowake(
     response: Response,
     _user: Dict[str, Any] = Depends(require_full_access),
-):
+) -> Dict[str, Any]:
     """Explicitly start the configured SearXNG runtime when autowake is enabled."""
     result = await ensure_searxng()
     if result.get("status") != "ready":
@@ -248,7 +277,7 @@ async def finance_ladder_probe(
     response: Response,
     _user: Dict[str, Any] = Depends(require_full_access),
     finance_service: FinanceService = Depends(get_finance_service),
-):
+) -> Dict[str, Any]:
     """Probe all finance ladders on one known symbol per market.
 
     Intended for nightly monitoring — each rung gets a real HTTP request.
@@ -285,7 +314,7 @@ async def finance_ladder_probe(
 async def runtime_check(
     response: Response,
     _user: Dict[str, Any] = Depends(require_full_access),
-):
+) -> Dict[str, Any]:
     """Cheap runtime state for agents and local supervisors."""
     try:
         session_service = get_session_service_if_initialized()
@@ -40,7 +40,7 @@ async def create_session(
         return SessionResponse(
             success=True,
             session_id=session_data.session_id,
-            config=session_data.config.dict(),
+            config=session_data.config.model_dump(),
             expires_at=session_data.context.expires_at
         )
         
@@ -109,7 +109,7 @@ async def list_sessions(
 async def monitor_sessions(
     session_service: SessionService = Depends(get_session_service),
     user: Dict[str, Any] = Depends(get_current_user)
-):
+) -> Dict[str, Any]:
     """Return session lifecycle and blocker state."""
     try:
         return {"success": True, "data": await session_service.monitor_sessions()}
@@ -123,7 +123,7 @@ async def reap_sessions(
     request: SessionReapRequest = SessionReapRequest(),
     session_service: SessionService = Depends(get_session_service),
     user: Dict[str, Any] = Depends(get_current_user)
-):
+) -> Dict[str, Any]:
     """Manually reap idle or expired sessions."""
     try:
         return {"success": True, "data": await session_service.reap_idle_sessions(dry_run=request.dry_run)}
@@ -138,7 +138,7 @@ async def touch_session(
     request: SessionTouchRequest = SessionTouchRequest(),
     session_service: SessionService = Depends(get_session_service),
     user: Dict[str, Any] = Depends(get_current_user)
-):
+) -> Dict[str, Any]:
     """Heartbeat a session to extend its idle lifetime."""
     try:
         return {"success": True, "data": await session_service.touch_session(session_id, reason=request.reason)}
@@ -154,7 +154,7 @@ async def get_session_stats(
     session_id: str,
     session_service: SessionService = Depends(get_session_service),
     user: Dict[str, Any] = Depends(get_current_user)
-):
+) -> Dict[str, Any]:
     """Get detailed session statistics"""
     
     try:
@@ -181,7 +181,7 @@ async def close_session(
     session_service: SessionService = Depends(get_session_service),
     browser_service: BrowserService = Depends(get_browser_service),
     user: Dict[str, Any] = Depends(get_current_user)
-):
+) -> Dict[str, Any]:
     """Close browser session and cleanup resources"""
 
     try:
@@ -212,7 +212,7 @@ async def get_session_info(
     session_id: str,
     session_service: SessionService = Depends(get_session_service),
     user: Dict[str, Any] = Depends(get_current_user)
-):
+) -> Dict[str, Any]:
     """Get session information and statistics"""
 
     try:
@@ -228,7 +228,7 @@ async def get_session_info(
                 "last_activity": session.context.last_activity,
                 "url": session.context.url,
                 "title": session.context.title,
-                "config": session.config.dict(),
+                "config": session.config.model_dump(),
                 "stats": stats
             }
         }
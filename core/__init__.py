@@ -19,9 +19,9 @@ from .foundation import (
     SecurityMiddleware,
     RateLimitMiddleware,
     RequestSizeLimitMiddleware,
-    ErrorHandlingMiddleware,
-    CORSMiddleware,
-    RequestIDMiddleware,
+    install_cors,
+    # Exception handlers
+    surf_exception_handler,
     # Dependencies
     get_current_user,
     get_optional_user,
@@ -61,9 +61,9 @@ __all__ = [
     "SecurityMiddleware",
     "RateLimitMiddleware",
     "RequestSizeLimitMiddleware",
-    "ErrorHandlingMiddleware",
-    "CORSMiddleware",
-    "RequestIDMiddleware",
+    "install_cors",
+    # Exception handlers
+    "surf_exception_handler",
     # Dependencies
     "get_current_user",
     "get_optional_user",
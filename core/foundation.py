@@ -1,12 +1,16 @@
 """Consolidated core foundation for Surf Browser Service"""
+import binascii
+import math
 import time
 import asyncio
-import secrets
+import itertools
 import uuid
-from typing import Callable, Optional, Dict, Any
-from fastapi import Request, Response, HTTPException, status, Depends
-from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Final, Mapping, Tuple
+from fastapi import Request, HTTPException, status, Depends
+from fastapi.responses import JSONResponse, Response
+from starlette.datastructures import Headers
 from starlette.middleware.cors import CORSMiddleware as StarletteCORSMiddleware
 import structlog
 
@@ -20,66 +24,162 @@ settings = get_settings()
 # EXCEPTIONS
 # ============================================================================
 
+# Error codes carried in the response envelope. Exceptions and middleware
+# share these so the same condition always reports the same code.
+CODE_SURF_ERROR: Final = "SURF_ERROR"
+CODE_SESSION_NOT_FOUND: Final = "SESSION_NOT_FOUND"
+CODE_INVALID_SESSION: Final = "INVALID_SESSION"
+CODE_BROWSER_OPERATION_ERROR: Final = "BROWSER_OPERATION_ERROR"
+CODE_AUTHENTICATION_ERROR: Final = "AUTHENTICATION_ERROR"
+CODE_RATE_LIMIT_EXCEEDED: Final = "RATE_LIMIT_EXCEEDED"
+CODE_VALIDATION_ERROR: Final = "VALIDATION_ERROR"
+CODE_CONFIGURATION_ERROR: Final = "CONFIGURATION_ERROR"
+CODE_CACHE_ERROR: Final = "CACHE_ERROR"
+CODE_RESOURCE_LIMIT_ERROR: Final = "RESOURCE_LIMIT_ERROR"
+CODE_SESSION_BUSY: Final = "SESSION_BUSY"
+CODE_PROFILE_IN_USE: Final = "PROFILE_IN_USE"
+CODE_REQUEST_TOO_LARGE: Final = "REQUEST_TOO_LARGE"
+CODE_INVALID_CONTENT_LENGTH: Final = "INVALID_CONTENT_LENGTH"
+CODE_INTERNAL_ERROR: Final = "INTERNAL_ERROR"
+
+
 class SurfException(Exception):
-    """Base exception for Surf Browser Service"""
+    """Base exception for Surf Browser Service
+
+    ``message`` may be a %-style template with ``message_args``; it is only
+    formatted when the message is first read, so errors that are caught and
+    dropped never pay for it.
+    """
     
-    def __init__(self, message: str, error_code: str = "SURF_ERROR", details: Optional[Dict[str, Any]] = None):
-        self.message = message
+    __slots__ = ("_message", "_message_args", "_formatted", "error_code", "details")
+    
+    def __init__(
+        self,
+        message: str,
+        error_code: str = CODE_SURF_ERROR,
+        details: Optional[Dict[str, Any]] = None,
+        message_args: Tuple[Any, ...] = (),
+    ):
+        self._message = message
+        self._message_args = message_args
+        self._formatted: Optional[str] = None
         self.error_code = error_code
         self.details = details or {}
-        super().__init__(self.message)
+        super().__init__()
+    
+    @property
+    def message(self) -> str:
+        if self._formatted is None:
+            if self._message_args:
+                self._formatted = self._message % self._message_args
+            else:
+                self._formatted = self._message
+        return self._formatted
+    
+    @message.setter
+    def message(self, value: str) -> None:
+        self._message = self._formatted = value
+        self._message_args = ()
+    
+    @property
+    def args(self) -> Tuple[str, ...]:
+        return (self.message,)
+    
+    @args.setter
+    def args(self, value: Tuple[Any, ...]) -> None:
+        self.message = str(value[0]) if value else ""
+    
+    def __str__(self) -> str:
+        return self.message
+    
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.message!r})"
+    
+    def __reduce__(self):
+        # Subclass constructors take their own arguments, so rebuild through
+        # the base initializer; the template stays unformatted across pickling.
+        return (
+            _rebuild_surf_exception,
+            (type(self), self._message, self.error_code, self.details, self._message_args),
+        )
+
+
+def _rebuild_surf_exception(
+    cls: type,
+    message: str,
+    error_code: str,
+    details: Dict[str, Any],
+    message_args: Tuple[Any, ...],
+) -> SurfException:
+    exc = cls.__new__(cls)
+    SurfException.__init__(exc, message, error_code, details, message_args)
+    return exc
 
 
 class SessionNotFoundError(SurfException):
     """Raised when session is not found"""
+
+    __slots__ = ()
     
     def __init__(self, session_id: str):
         super().__init__(
-            message=f"Session {session_id} not found",
-            error_code="SESSION_NOT_FOUND",
+            message="Session %s not found",
+            message_args=(session_id,),
+            error_code=CODE_SESSION_NOT_FOUND,
             details={"session_id": session_id}
         )
 
 
 class InvalidSessionError(SurfException):
     """Raised when session is invalid or expired"""
+
+    __slots__ = ()
     
     def __init__(self, session_id: str, reason: str = "Session expired"):
         super().__init__(
-            message=f"Invalid session {session_id}: {reason}",
-            error_code="INVALID_SESSION",
+            message="Invalid session %s: %s",
+            message_args=(session_id, reason),
+            error_code=CODE_INVALID_SESSION,
             details={"session_id": session_id, "reason": reason}
         )
 
 
 class BrowserOperationError(SurfException):
     """Raised when browser operation fails"""
+
+    __slots__ = ()
     
     def __init__(self, operation: str, message: str, details: Optional[Dict[str, Any]] = None):
         super().__init__(
-            message=f"Browser operation '{operation}' failed: {message}",
-            error_code="BROWSER_OPERATION_ERROR",
+            message="Browser operation '%s' failed: %s",
+            message_args=(operation, message),
+            error_code=CODE_BROWSER_OPERATION_ERROR,
             details={"operation": operation, **(details or {})}
         )
 
 
 class AuthenticationError(SurfException):
     """Raised when authentication fails"""
+
+    __slots__ = ()
     
     def __init__(self, message: str = "Authentication failed"):
         super().__init__(
             message=message,
-            error_code="AUTHENTICATION_ERROR"
+            error_code=CODE_AUTHENTICATION_ERROR
         )
 
 
 class RateLimitExceededError(SurfException):
     """Raised when rate limit is exceeded"""
+
+    __slots__ = ()
     
     def __init__(self, limit: int, window: int, retry_after: int):
         super().__init__(
-            message=f"Rate limit exceeded: {limit} requests per {window} seconds",
-            error_code="RATE_LIMIT_EXCEEDED",
+            message="Rate limit exceeded: %s requests per %s seconds",
+            message_args=(limit, window),
+            error_code=CODE_RATE_LIMIT_EXCEEDED,
             details={
                 "limit": limit,
                 "window": window,
@@ -90,44 +190,56 @@ class RateLimitExceededError(SurfException):
 
 class ValidationError(SurfException):
     """Raised when input validation fails"""
+
+    __slots__ = ()
     
     def __init__(self, field: str, message: str, value: Any = None):
         super().__init__(
-            message=f"Validation error for field '{field}': {message}",
-            error_code="VALIDATION_ERROR",
+            message="Validation error for field '%s': %s",
+            message_args=(field, message),
+            error_code=CODE_VALIDATION_ERROR,
             details={"field": field, "value": value}
         )
 
 
 class ConfigurationError(SurfException):
     """Raised when configuration is invalid"""
+
+    __slots__ = ()
     
     def __init__(self, setting: str, message: str):
         super().__init__(
-            message=f"Configuration error for '{setting}': {message}",
-            error_code="CONFIGURATION_ERROR",
+            message="Configuration error for '%s': %s",
+            message_args=(setting, message),
+            error_code=CODE_CONFIGURATION_ERROR,
             details={"setting": setting}
         )
 
 
 class CacheError(SurfException):
     """Raised when cache operation fails"""
+
+    __slots__ = ()
     
     def __init__(self, operation: str, message: str):
         super().__init__(
-            message=f"Cache operation '{operation}' failed: {message}",
-            error_code="CACHE_ERROR",
+            message="Cache operation '%s' failed: %s",
+            message_args=(operation, message),
+            error_code=CODE_CACHE_ERROR,
             details={"operation": operation}
         )
 
 
 class ResourceLimitError(SurfException):
     """Raised when resource limits are exceeded"""
+
+    __slots__ = ()
     
     def __init__(self, resource: str, limit: int, current: int):
         super().__init__(
-            message=f"Resource limit exceeded for '{resource}': {current}/{limit}",
-            error_code="RESOURCE_LIMIT_ERROR",
+            message="Resource limit exceeded for '%s': %s/%s",
+            message_args=(resource, current, limit),
+            error_code=CODE_RESOURCE_LIMIT_ERROR,
             details={"resource": resource, "limit": limit, "current": current}
         )
 
@@ -135,10 +247,13 @@ class ResourceLimitError(SurfException):
 class SessionBusyError(SurfException):
     """Raised when an operation conflicts with active session work"""
 
+    __slots__ = ()
+
     def __init__(self, session_id: str, operation: str = "operation"):
         super().__init__(
-            message=f"Session {session_id} is busy; retry after the active operation completes",
-            error_code="SESSION_BUSY",
+            message="Session %s is busy; retry after the active operation completes",
+            message_args=(session_id,),
+            error_code=CODE_SESSION_BUSY,
             details={"session_id": session_id, "operation": operation}
         )
 
@@ -146,10 +261,13 @@ class SessionBusyError(SurfException):
 class ProfileInUseError(SurfException):
     """Raised when a persistent browser profile is already leased"""
 
+    __slots__ = ()
+
     def __init__(self, profile_id: str):
         super().__init__(
-            message=f"Persistent profile '{profile_id}' is already active",
-            error_code="PROFILE_IN_USE",
+            message="Persistent profile '%s' is already active",
+            message_args=(profile_id,),
+            error_code=CODE_PROFILE_IN_USE,
             details={"profile_id": profile_id}
         )
 
@@ -158,81 +276,188 @@ class ProfileInUseError(SurfException):
 # MIDDLEWARE
 # ============================================================================
 
-class LoggingMiddleware(BaseHTTPMiddleware):
-    """Middleware for request/response logging"""
+# Orchestrator probes polled every few seconds; logging them is pure noise.
+_UNLOGGED_PROBE_PATHS = frozenset({"/health/live", "/health/ready"})
+_SLOW_REQUEST_SECONDS = 0.5
+_request_log_counter = itertools.count()
+
+
+class LoggingMiddleware:
+    """Middleware for request IDs and request/response logging"""
+    
+    def __init__(self, app):
+        self.app = app
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        start_time = time.time()
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         
-        # Log request
-        logger.info(
-            "Request started",
-            method=request.method,
-            path=request.url.path,
-            client_ip=request.client.host if request.client else None,
-            user_agent=request.headers.get("user-agent")
-        )
+        # Dashless hex, already encoded for the response header
+        request_id = binascii.hexlify(uuid.uuid4().bytes)
+        scope.setdefault("state", {})["request_id"] = request_id.decode("ascii")
         
-        # Process request
-        response = await call_next(request)
+        start_time = time.perf_counter()
+        status_code = None
+        
+        async def send_with_context(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", ()), (b"x-request-id", request_id)]
+            await send(message)
+        
+        # Process request. Unhandled errors are answered here, inside
+        # SecurityMiddleware, so the 500 still carries the security headers,
+        # X-Request-ID and a completion log.
+        try:
+            await self.app(scope, receive, send_with_context)
+        except Exception as exc:
+            logger.error(
+                "Unhandled exception",
+                request_id=scope["state"]["request_id"],
+                error=str(exc),
+                error_type=type(exc).__name__,
+                path=scope["path"],
+                method=scope["method"],
+                exc_info=True
+            )
+            if status_code is not None:
+                # The response already started; there is nothing left to send.
+                raise
+            await send_with_context({
+                "type": "http.response.start",
+                "status": 500,
+                "headers": _INTERNAL_ERROR_HEADERS,
+            })
+            await send_with_context({"type": "http.response.body", "body": _INTERNAL_ERROR_BODY})
+        if scope["path"] in _UNLOGGED_PROBE_PATHS:
+            return
         
         # Calculate duration
-        duration = time.time() - start_time
+        duration = time.perf_counter() - start_time
+        
+        # Errors and slow requests are always logged; the rest are sampled.
+        sample_rate = settings.request_log_sample_rate
+        if (
+            sample_rate > 1
+            and status_code is not None
+            and status_code < 400
+            and duration < _SLOW_REQUEST_SECONDS
+            and next(_request_log_counter) % sample_rate
+        ):
+            return
         
         # Log response
+        client = scope.get("client")
         logger.info(
             "Request completed",
-            method=request.method,
-            path=request.url.path,
-            status_code=response.status_code,
-            duration_ms=int(duration * 1000)
+            request_id=scope["state"]["request_id"],
+            method=scope["method"],
+            path=scope["path"],
+            status_code=status_code,
+            duration_ms=int(duration * 1000),
+            client_ip=client[0] if client else None,
+            user_agent=Headers(scope=scope).get("user-agent")
         )
-        
-        return response
 
 
-class SecurityMiddleware(BaseHTTPMiddleware):
+class SecurityMiddleware:
     """Security middleware for request validation and protection"""
 
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        allowed = _route_profiles(request.method, request.url.path)
-        principal, invalid_bearer = _request_principal(request)
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        allowed = _route_profiles(scope["method"], scope["path"])
+        profile_keys = settings.profile_keys()
+        principal, invalid_bearer = _request_principal(
+            Headers(scope=scope).get("authorization", ""), profile_keys
+        )
         if principal is None and "web" in allowed and not invalid_bearer:
             if settings.allows_keyless_web():
-                principal = {
-                    "username": "surf-web",
-                    "profile": "web",
-                    "scopes": ["web:read"],
-                    "auth_type": "keyless_private",
-                }
+                principal = _KEYLESS_WEB_PRINCIPAL
         if principal is None:
-            profile_keys = settings.profile_keys()
             specialist_allowed = allowed.intersection(profile_keys)
             if specialist_allowed and all(
                 profile_keys[profile] is None for profile in specialist_allowed
             ):
-                return JSONResponse(status_code=404, content={"detail": "Profile disabled"})
-            return JSONResponse(
-                status_code=401,
-                content={"detail": "Authentication required"},
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+                response = Response(
+                    _PROFILE_DISABLED_BODY, status_code=404, media_type="application/json"
+                )
+            else:
+                response = Response(
+                    _AUTH_REQUIRED_BODY,
+                    status_code=401,
+                    headers={"WWW-Authenticate": "Bearer"},
+                    media_type="application/json",
+                )
+            await response(scope, receive, send)
+            return
         if principal["profile"] not in allowed:
-            return JSONResponse(
-                status_code=403,
-                content={"detail": "Profile is not allowed for this route"},
+            response = Response(
+                _PROFILE_FORBIDDEN_BODY, status_code=403, media_type="application/json"
             )
-        request.state.user = principal
+            await response(scope, receive, send)
+            return
+        scope.setdefault("state", {})["user"] = principal
 
         # Add security headers
-        response = await call_next(request)
-        
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-XSS-Protection"] = "1; mode=block"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        
-        return response
+        async def send_with_security_headers(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", ()), *_SECURITY_HEADERS]
+            await send(message)
+
+        await self.app(scope, receive, send_with_security_headers)
+
+
+# Raw ASGI header pairs appended to every authorized response.
+_SECURITY_HEADERS = (
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+    (b"referrer-policy", b"strict-origin-when-cross-origin"),
+)
+
+# Fixed rejection bodies, serialized once with JSONResponse's own encoder.
+_PROFILE_DISABLED_BODY = JSONResponse({"detail": "Profile disabled"}).body
+_AUTH_REQUIRED_BODY = JSONResponse({"detail": "Authentication required"}).body
+_PROFILE_FORBIDDEN_BODY = JSONResponse({"detail": "Profile is not allowed for this route"}).body
+_INVALID_CONTENT_LENGTH_BODY = JSONResponse({
+    "success": False,
+    "error": {"code": CODE_INVALID_CONTENT_LENGTH, "message": "Invalid Content-Length header"},
+}).body
+_INTERNAL_ERROR_BODY = JSONResponse({
+    "success": False,
+    "error": {"code": CODE_INTERNAL_ERROR, "message": "An unexpected error occurred"},
+}).body
+_INTERNAL_ERROR_HEADERS = (
+    (b"content-type", b"application/json"),
+    (b"content-length", str(len(_INTERNAL_ERROR_BODY)).encode("ascii")),
+)
+
+# Principals are identical for every request of a profile, so they are built
+# once and shared as read-only mappings. Scopes are frozensets so
+# require_scope checks membership by hash.
+_KEYLESS_WEB_PRINCIPAL = MappingProxyType({
+    "username": "surf-web",
+    "profile": "web",
+    "scopes": frozenset({"web:read"}),
+    "auth_type": "keyless_private",
+})
+_PROFILE_PRINCIPALS = {
+    profile: MappingProxyType({
+        "username": f"surf-{profile}",
+        "profile": profile,
+        "scopes": frozenset({f"{profile}:access"}),
+        "auth_type": "profile_key",
+    })
+    for profile in ("browse", "ui", "finance", "ops")
+}
 
 
 _UI_ONLY_BROWSER_PATHS = frozenset(
@@ -240,42 +465,57 @@ _UI_ONLY_BROWSER_PATHS = frozenset(
 )
 
 
+# Route profile sets are shared constants so classifying a request returns
+# an existing frozenset instead of building one per call.
+_WEB_ONLY = frozenset({"web"})
+_OPS_ONLY = frozenset({"ops"})
+_UI_ONLY = frozenset({"ui"})
+_FINANCE_ONLY = frozenset({"finance"})
+_BROWSER_PROFILES = frozenset({"browse", "ui"})
+_FETCH_PROFILES = frozenset({"web", "browse", "ui"})
+_ARTIFACT_PROFILES = frozenset({"web", "browse", "ui", "finance"})
+_FINANCE_HEALTH_PROFILES = frozenset({"finance", "ops"})
+_RUNTIME_HEALTH_PROFILES = frozenset({"browse", "ui", "ops"})
+_SEARXNG_HEALTH_PROFILES = frozenset({"web", "ops"})
+_MCP_PROFILES = {
+    profile: frozenset({profile}) for profile in ("web", "browse", "ui", "finance")
+}
+
+
 def _route_profiles(method: str, path: str) -> frozenset[str]:
     """Return the exact profile set authorized for one HTTP route."""
     if path in {"/", "/health/live", "/health/ready"}:
-        return frozenset({"web"})
+        return _WEB_ONLY
     if path.startswith("/mcp/"):
-        profile = path.split("/", 3)[2]
-        return frozenset({profile}) if profile in {"web", "browse", "ui", "finance"} else frozenset({"ops"})
+        return _MCP_PROFILES.get(path.split("/", 3)[2], _OPS_ONLY)
     if path.startswith(("/search/", "/youtube/")):
-        return frozenset({"web"})
+        return _WEB_ONLY
     if path.startswith("/fetch/"):
-        return frozenset({"web", "browse", "ui"})
+        return _FETCH_PROFILES
     if path.startswith("/artifacts/"):
-        return frozenset({"web", "browse", "ui", "finance"})
+        return _ARTIFACT_PROFILES
     if path.startswith("/finance/"):
-        return frozenset({"finance"})
+        return _FINANCE_ONLY
     if path in {"/sessions/monitor", "/sessions/reap"}:
-        return frozenset({"ops"})
+        return _OPS_ONLY
     if path.startswith("/sessions/"):
-        return frozenset({"browse", "ui"})
+        return _BROWSER_PROFILES
     if path in _UI_ONLY_BROWSER_PATHS:
-        return frozenset({"ui"})
+        return _UI_ONLY
     if path.startswith(("/browser/", "/browse/", "/downloads/")):
-        return frozenset({"browse", "ui"})
+        return _BROWSER_PROFILES
     if path == "/health/finance":
-        return frozenset({"finance", "ops"})
+        return _FINANCE_HEALTH_PROFILES
     if path == "/health/runtime":
-        return frozenset({"browse", "ui", "ops"})
+        return _RUNTIME_HEALTH_PROFILES
     if path == "/health/searxng" and method.upper() == "GET":
-        return frozenset({"web", "ops"})
-    if path.startswith("/health/") or path == "/health":
-        return frozenset({"ops"})
-    return frozenset({"ops"})
+        return _SEARXNG_HEALTH_PROFILES
+    return _OPS_ONLY
 
 
-def _request_principal(request: Request) -> tuple[Optional[Dict[str, Any]], bool]:
-    auth_header = request.headers.get("authorization", "")
+def _request_principal(
+    auth_header: str, profile_keys: Dict[str, Optional[str]]
+) -> tuple[Optional[Mapping[str, Any]], bool]:
     if not auth_header:
         return None, False
     if not auth_header.lower().startswith("bearer "):
@@ -283,15 +523,10 @@ def _request_principal(request: Request) -> tuple[Optional[Dict[str, Any]], bool
     provided = auth_header[len("bearer "):].strip()
     if not provided:
         return None, True
-    for profile, expected in settings.profile_keys().items():
-        if expected and secrets.compare_digest(provided, expected):
-            return {
-                "username": f"surf-{profile}",
-                "profile": profile,
-                "scopes": [f"{profile}:access"],
-                "auth_type": "profile_key",
-            }, False
-    return None, True
+    profile = SecurityConfig.resolve_profile_key(provided, profile_keys)
+    if profile is None:
+        return None, True
+    return _PROFILE_PRINCIPALS[profile], False
 
 
 class RequestSizeLimitMiddleware:
@@ -306,17 +541,19 @@ class RequestSizeLimitMiddleware:
             await self.app(scope, receive, send)
             return
 
-        headers = {
-            key.lower(): value for key, value in scope.get("headers", [])
-        }
-        declared = headers.get(b"content-length")
+        # ASGI header names arrive lowercased, so the raw pairs are scanned
+        # directly instead of building a header mapping per request.
+        declared = None
+        for key, value in scope.get("headers", ()):
+            if key == b"content-length":
+                declared = value
+                break
         if declared:
             try:
                 declared_size = int(declared)
             except ValueError:
-                await JSONResponse(
-                    status_code=400,
-                    content={"success": False, "error": {"code": "INVALID_CONTENT_LENGTH", "message": "Invalid Content-Length header"}},
+                await Response(
+                    _INVALID_CONTENT_LENGTH_BODY, status_code=400, media_type="application/json"
                 )(scope, receive, send)
                 return
             if declared_size > self.max_body_size:
@@ -357,7 +594,7 @@ class RequestSizeLimitMiddleware:
             content={
                 "success": False,
                 "error": {
-                    "code": "REQUEST_TOO_LARGE",
+                    "code": CODE_REQUEST_TOO_LARGE,
                     "message": "Request body exceeds the configured limit",
                     "details": {
                         "limit": self.max_body_size,
@@ -368,169 +605,125 @@ class RequestSizeLimitMiddleware:
         )(scope, receive, send)
 
 
-class RateLimitMiddleware(BaseHTTPMiddleware):
-    """Rate limiting middleware using in-memory storage"""
+class RateLimitMiddleware:
+    """Rate limiting middleware using in-memory token buckets"""
     
-    def __init__(self, app, requests_per_window: int = 100, window_seconds: int = 60):
-        super().__init__(app)
+    def __init__(
+        self,
+        app,
+        requests_per_window: int = 100,
+        window_seconds: int = 60,
+        max_clients: int = 10000,
+    ):
+        self.app = app
         self.requests_per_window = requests_per_window
         self.window_seconds = window_seconds
-        self.requests: Dict[str, list] = {}
+        self.max_clients = max_clients
+        # Each client may burst up to requests_per_window and earns tokens back
+        # at requests_per_window per window_seconds.
+        self.refill_rate = requests_per_window / max(window_seconds, 1)
+        # client -> (tokens, last_refill) on the monotonic clock, least
+        # recently seen first so address rotation cannot grow it unbounded.
+        self.buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
         self._request_count = 0
     
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        client_ip = request.client.host if request.client else "unknown"
-        current_time = time.time()
-        
-        if request.url.path == "/health/live":
-            return await call_next(request)
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["path"] == "/health/live":
+            await self.app(scope, receive, send)
+            return
+
+        client = scope.get("client")
+        client_ip = client[0] if client else "unknown"
+        now = time.monotonic()
+        capacity = self.requests_per_window
 
-        cutoff = current_time - self.window_seconds
         self._request_count += 1
         if self._request_count % 100 == 0:
-            self.requests = {
-                key: [timestamp for timestamp in timestamps if timestamp >= cutoff]
-                for key, timestamps in self.requests.items()
-                if any(timestamp >= cutoff for timestamp in timestamps)
-            }
+            # A bucket idle for a full window has refilled; forgetting it is
+            # equivalent to keeping it.
+            refilled = now - self.window_seconds
+            self.buckets = OrderedDict(
+                (key, bucket)
+                for key, bucket in self.buckets.items()
+                if bucket[1] > refilled
+            )
 
-        self.requests[client_ip] = [
-            timestamp
-            for timestamp in self.requests.get(client_ip, [])
-            if timestamp >= cutoff
-        ]
+        tokens, last_refill = self.buckets.pop(client_ip, (capacity, now))
+        tokens = min(capacity, tokens + (now - last_refill) * self.refill_rate)
+        # Re-inserted below as the most recent entry; evicting the oldest
+        # client only hands it a fresh bucket on its next request.
+        while len(self.buckets) >= self.max_clients > 0:
+            self.buckets.popitem(last=False)
         
         # Check rate limit
-        if len(self.requests[client_ip]) >= self.requests_per_window:
-            retry_after = max(
-                1,
-                int(self.window_seconds - (current_time - min(self.requests[client_ip]))),
-            )
-            return JSONResponse(
+        if tokens < 1:
+            self.buckets[client_ip] = (tokens, now)
+            if self.refill_rate:
+                retry_after = max(1, math.ceil((1 - tokens) / self.refill_rate))
+            else:
+                retry_after = max(1, self.window_seconds)
+            response = JSONResponse(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 content={
                     "success": False,
                     "error": {
-                        "code": "RATE_LIMIT_EXCEEDED",
+                        "code": CODE_RATE_LIMIT_EXCEEDED,
                         "message": "Rate limit exceeded",
                         "details": {"retry_after": retry_after},
                     },
                 },
                 headers={"Retry-After": str(retry_after)},
             )
+            await response(scope, receive, send)
+            return
         
-        # Add current request
-        self.requests[client_ip].append(current_time)
+        # Spend a token for the current request
+        self.buckets[client_ip] = (tokens - 1, now)
         
         # Process request
-        response = await call_next(request)
-        return response
-
-
-class ErrorHandlingMiddleware(BaseHTTPMiddleware):
-    """Middleware for consistent error handling"""
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        try:
-            response = await call_next(request)
-            return response
-        
-        except SurfException as e:
-            logger.error(
-                "Surf exception occurred",
-                error_code=e.error_code,
-                message=e.message,
-                details=e.details,
-                path=request.url.path,
-                method=request.method
-            )
-            
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "success": False,
-                    "error": {
-                        "code": e.error_code,
-                        "message": e.message,
-                        "details": e.details
-                    }
-                }
-            )
-        
-        except HTTPException as e:
-            logger.error(
-                "HTTP exception occurred",
-                status_code=e.status_code,
-                detail=e.detail,
-                path=request.url.path,
-                method=request.method
-            )
-            
-            return JSONResponse(
-                status_code=e.status_code,
-                content={
-                    "success": False,
-                    "error": {
-                        "code": "HTTP_ERROR",
-                        "message": str(e.detail)
-                    }
-                }
-            )
-        
-        except Exception as e:
-            logger.error(
-                "Unexpected error occurred",
-                error=str(e),
-                error_type=type(e).__name__,
-                path=request.url.path,
-                method=request.method,
-                exc_info=True
-            )
-            
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "success": False,
-                    "error": {
-                        "code": "INTERNAL_ERROR",
-                        "message": "An unexpected error occurred"
-                    }
-                }
-            )
-
-
-class CORSMiddleware:
-    """CORS middleware configuration"""
+        await self.app(scope, receive, send)
+
+
+async def surf_exception_handler(request: Request, exc: SurfException) -> JSONResponse:
+    """Render a SurfException as the service's error envelope.
+
+    Registered on the app's exception-handler table, so errors are routed by
+    type and successful requests pay nothing for it.
+    """
+    logger.error(
+        "Surf exception occurred",
+        error_code=exc.error_code,
+        message=exc.message,
+        details=exc.details,
+        path=request.url.path,
+        method=request.method
+    )
     
-    @staticmethod
-    def get_middleware():
-        """Get configured CORS middleware"""
-        return StarletteCORSMiddleware(
-            app=None,  # Will be set by FastAPI
-            allow_origins=settings.cors_origins,
-            allow_credentials=True,
-            allow_methods=settings.cors_methods,
-            allow_headers=settings.cors_headers,
-            expose_headers=["X-Request-ID", "X-Response-Time"]
-        )
+    return JSONResponse(
+        status_code=400,
+        content={
+            "success": False,
+            "error": {
+                "code": exc.error_code,
+                "message": exc.message,
+                "details": exc.details
+            }
+        }
+    )
 
 
-class RequestIDMiddleware(BaseHTTPMiddleware):
-    """Middleware to add request ID for tracing"""
-    
-    async def dispatch(self, request: Request, call_next: Callable) -> Response:
-        request_id = str(uuid.uuid4())
-        
-        # Add request ID to request state
-        request.state.request_id = request_id
-        
-        # Process request
-        response = await call_next(request)
-        
-        # Add request ID to response headers
-        response.headers["X-Request-ID"] = request_id
-        
-        return response
+def install_cors(app) -> None:
+    """Register the configured CORS middleware on the app once"""
+    # Origins are matched on every cross-origin request, so hand Starlette a
+    # frozenset; methods stay ordered because they are joined into a header.
+    app.add_middleware(
+        StarletteCORSMiddleware,
+        allow_origins=frozenset(settings.cors_origins),
+        allow_credentials=True,
+        allow_methods=tuple(settings.cors_methods),
+        allow_headers=tuple(settings.cors_headers),
+        expose_headers=("X-Request-ID", "X-Response-Time"),
+    )
 
 
 # ============================================================================
@@ -588,7 +781,7 @@ def require_scope(required_scope: str):
     """Require specific scope for endpoint access"""
     
     def scope_checker(user: Dict[str, Any] = Depends(require_auth)) -> Dict[str, Any]:
-        if required_scope not in user.get("scopes", []):
+        if required_scope not in user.get("scopes", ()):
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Scope '{required_scope}' required"
@@ -612,15 +805,28 @@ _search_service: Optional[Any] = None
 _finance_service: Optional[Any] = None
 _youtube_transcript_service: Optional[Any] = None
 
+# Guards the getters whose construction awaits, so concurrent cold-start
+# requests build and initialize each service exactly once. The warm path
+# returns before touching the lock.
+_init_locks: Dict[str, asyncio.Lock] = {
+    name: asyncio.Lock()
+    for name in ("session", "browser", "browse", "cache", "adblock", "finance", "youtube_transcript")
+}
+
 
 async def get_session_service():
     """Get session service instance"""
     global _session_service
     
-    if _session_service is None:
-        from services.session_service import SessionService
-        _session_service = SessionService()
-        await _session_service.initialize()
+    if _session_service is not None:
+        return _session_service
+    
+    async with _init_locks["session"]:
+        if _session_service is None:
+            from services.session_service import SessionService
+            service = SessionService()
+            await service.initialize()
+            _session_service = service
     
     return _session_service
 
@@ -634,10 +840,15 @@ async def get_browser_service():
     """Get browser service instance"""
     global _browser_service
 
-    if _browser_service is None:
-        from services.browser_service import BrowserService
-        _browser_service = BrowserService()
-        await _browser_service.initialize()
+    if _browser_service is not None:
+        return _browser_service
+
+    async with _init_locks["browser"]:
+        if _browser_service is None:
+            from services.browser_service import BrowserService
+            service = BrowserService()
+            await service.initialize()
+            _browser_service = service
 
     return _browser_service
 
@@ -646,10 +857,15 @@ async def get_browse_service():
     """Get browse service instance"""
     global _browse_service
 
-    if _browse_service is None:
-        from services.browse_service import BrowseService
-        _browse_service = BrowseService()
-        await _browse_service.initialize()
+    if _browse_service is not None:
+        return _browse_service
+
+    async with _init_locks["browse"]:
+        if _browse_service is None:
+            from services.browse_service import BrowseService
+            service = BrowseService()
+            await service.initialize()
+            _browse_service = service
 
     return _browse_service
 
@@ -681,10 +897,15 @@ async def get_cache_service():
     """Get cache service instance"""
     global _cache_service
     
-    if _cache_service is None:
-        from services.cache_service import CacheService
-        _cache_service = CacheService()
-        await _cache_service.initialize()
+    if _cache_service is not None:
+        return _cache_service
+    
+    async with _init_locks["cache"]:
+        if _cache_service is None:
+            from services.cache_service import CacheService
+            service = CacheService()
+            await service.initialize()
+            _cache_service = service
     
     return _cache_service
 
@@ -715,10 +936,15 @@ async def get_adblock_service():
     """Get adblock service instance"""
     global _adblock_service
 
-    if _adblock_service is None:
-        from services.adblock_service import AdblockService
-        _adblock_service = AdblockService()
-        await _adblock_service.initialize()
+    if _adblock_service is not None:
+        return _adblock_service
+
+    async with _init_locks["adblock"]:
+        if _adblock_service is None:
+            from services.adblock_service import AdblockService
+            service = AdblockService()
+            await service.initialize()
+            _adblock_service = service
 
     return _adblock_service
 
@@ -738,12 +964,16 @@ async def get_finance_service():
     """Get finance service instance"""
     global _finance_service
 
-    if _finance_service is None:
-        from services.finance_service import FinanceService
-        fetch = await get_fetch_service()
-        search = await get_search_service()
-        cache = await get_cache_service()
-        _finance_service = FinanceService(fetch, search, cache)
+    if _finance_service is not None:
+        return _finance_service
+
+    async with _init_locks["finance"]:
+        if _finance_service is None:
+            from services.finance_service import FinanceService
+            fetch = await get_fetch_service()
+            search = await get_search_service()
+            cache = await get_cache_service()
+            _finance_service = FinanceService(fetch, search, cache)
 
     return _finance_service
 
@@ -752,15 +982,19 @@ async def get_youtube_transcript_service():
     """Return the caption-backed YouTube transcript service."""
     global _youtube_transcript_service
 
-    if _youtube_transcript_service is None:
-        from services.youtube_transcript_service import YoutubeTranscriptService
+    if _youtube_transcript_service is not None:
+        return _youtube_transcript_service
 
-        fetch = await get_fetch_service()
-        downloads = await get_download_service()
-        cache = await get_cache_service()
-        _youtube_transcript_service = YoutubeTranscriptService(
-            fetch, downloads, cache
-        )
+    async with _init_locks["youtube_transcript"]:
+        if _youtube_transcript_service is None:
+            from services.youtube_transcript_service import YoutubeTranscriptService
+
+            fetch = await get_fetch_service()
+            downloads = await get_download_service()
+            cache = await get_cache_service()
+            _youtube_transcript_service = YoutubeTranscriptService(
+                fetch, downloads, cache
+            )
     return _youtube_transcript_service
 
 
@@ -836,9 +1070,12 @@ async def cleanup_services():
         await _cache_service.cleanup()
         _cache_service = None
 
+    if _search_service:
+        await _search_service.cleanup()
+        _search_service = None
+
     _fetch_service = None
     _download_service = None
     _adblock_service = None
-    _search_service = None
     _finance_service = None
     _youtube_transcript_service = None
@@ -2,8 +2,7 @@
 import asyncio
 from contextlib import AsyncExitStack, asynccontextmanager
 from fastapi import FastAPI, Request
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from starlette.routing import Route
 import structlog
 
@@ -13,9 +12,11 @@ from core.foundation import (
     SecurityMiddleware,
     RequestSizeLimitMiddleware,
     RateLimitMiddleware,
-    ErrorHandlingMiddleware,
-    RequestIDMiddleware,
-    cleanup_services
+    SurfException,
+    _INTERNAL_ERROR_BODY,
+    cleanup_services,
+    install_cors,
+    surf_exception_handler,
 )
 from controllers import browser_controller, session_controller, health_controller, fetch_controller, download_controller, artifact_controller, search_controller, finance_controller, youtube_controller, browse_controller
 from utils.logging import configure_logging
@@ -62,7 +63,17 @@ async def lifespan(app: FastAPI):
             loop.default_exception_handler(context)
 
     loop.set_exception_handler(handle_loop_exception)
-    logger.info("Starting Surf Browser Service", version="1.0.0")
+    # Eager tasks run until their first await without a scheduler round trip.
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    eager_tasks = settings.eager_tasks and eager_task_factory is not None
+    if eager_tasks:
+        loop.set_task_factory(eager_task_factory)
+    logger.info(
+        "Starting Surf Browser Service",
+        version="1.0.0",
+        event_loop=f"{type(loop).__module__}.{type(loop).__qualname__}",
+        eager_tasks=eager_tasks,
+    )
     try:
         async with AsyncExitStack() as stack:
             servers = {
@@ -98,8 +109,6 @@ app = FastAPI(
 )
 
 # Add middleware
-app.add_middleware(RequestIDMiddleware)
-app.add_middleware(ErrorHandlingMiddleware)
 app.add_middleware(LoggingMiddleware)
 app.add_middleware(SecurityMiddleware)
 app.add_middleware(
@@ -111,14 +120,7 @@ app.add_middleware(
     RequestSizeLimitMiddleware,
     max_body_size=settings.max_request_size,
 )
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=settings.cors_origins,
-    allow_credentials=True,
-    allow_methods=settings.cors_methods,
-    allow_headers=settings.cors_headers,
-    expose_headers=["X-Request-ID", "X-Response-Time"]
-)
+install_cors(app)
 
 # Include routers
 app.include_router(session_controller.router, prefix="/sessions", tags=["Sessions"])
@@ -139,22 +141,33 @@ for profile in PROFILE_TOOLS:
         Route(f"/mcp/{profile}", endpoint=ProfileMCPEndpoint(profile))
     )
 
-# Root endpoint
+# Root endpoint. Its content is fixed for the life of the process, as is
+# docs_url above, so the body is serialized once.
+_ROOT_BODY = JSONResponse({
+    "service": "Surf Browser Service",
+    "version": "1.0.0",
+    "status": "running",
+    "docs": "/docs" if settings.debug else "disabled"
+}).body
+
+
 @app.get("/")
-async def root():
+async def root() -> Response:
     """Root endpoint with service information"""
-    return {
-        "service": "Surf Browser Service",
-        "version": "1.0.0",
-        "status": "running",
-        "docs": "/docs" if settings.debug else "disabled"
-    }
+    return Response(_ROOT_BODY, media_type="application/json")
+
+
+# Exception handlers
+app.add_exception_handler(SurfException, surf_exception_handler)
 
 
-# Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
-    """Global exception handler for unhandled errors"""
+    """Last-resort handler for errors raised outside LoggingMiddleware
+
+    Route errors are answered by LoggingMiddleware; this only sees failures
+    in the middleware wrapped around it.
+    """
     logger.error(
         "Unhandled exception",
         error=str(exc),
@@ -164,16 +177,7 @@ async def global_exception_handler(request: Request, exc: Exception):
         exc_info=True
     )
     
-    return JSONResponse(
-        status_code=500,
-        content={
-            "success": False,
-            "error": {
-                "code": "INTERNAL_ERROR",
-                "message": "An unexpected error occurred"
-            }
-        }
-    )
+    return Response(_INTERNAL_ERROR_BODY, status_code=500, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -184,5 +188,8 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         log_level=settings.log_level.lower(),
-        reload=settings.debug
+        reload=settings.debug,
+        interface="asgi3",
+        ws="none",
+        lifespan="on",
     )
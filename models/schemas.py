@@ -1,10 +1,22 @@
 """Consolidated Pydantic schemas for Surf Browser Service"""
 
-from typing import Optional, Dict, Any, List, Union
-from pydantic import BaseModel, ConfigDict, Field, StrictBool, validator, HttpUrl, field_validator
+from typing import Annotated, Optional, Dict, Any, List, Union
+from pydantic import BaseModel, ConfigDict, Field, StrictBool, StringConstraints, UrlConstraints, ValidationInfo, field_validator, model_validator
+from pydantic_core import Url
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 
+# Checked by pydantic-core's compiled pattern rather than a Python validator
+SessionId = Annotated[str, StringConstraints(pattern=r"^sess_")]
+
+# Validated straight into pydantic-core's Url, skipping the HttpUrl wrapper
+# class; the length cap matches the default max_url_length setting.
+WebUrl = Annotated[
+    Url,
+    UrlConstraints(allowed_schemes=["http", "https"], host_required=True, max_length=2048),
+]
+
 # ============================================================================
 # ENUMS
 # ============================================================================
@@ -41,6 +53,13 @@ class WaitUntil(str, Enum):
     COMMIT = "commit"
 
 
+class ScreenshotFormat(str, Enum):
+    """Screenshot image formats supported by the browser engine"""
+
+    PNG = "png"
+    JPEG = "jpeg"
+
+
 class SessionStatus(str, Enum):
     """Session status enumeration"""
 
@@ -184,7 +203,8 @@ class SessionCreateRequest(BaseModel):
         default=None, description="Persist browser storage across sessions"
     )
 
-    @validator("viewport")
+    @field_validator("viewport")
+    @classmethod
     def validate_viewport(cls, v: Optional[Dict[str, int]]) -> Optional[Dict[str, int]]:
         if v:
             if "width" not in v or "height" not in v:
@@ -196,29 +216,71 @@ class SessionCreateRequest(BaseModel):
         return v
 
 
+class ReadinessSpec(BaseModel):
+    """Page readiness conditions for dynamic/SPA content.
+
+    Only one condition is used: the first one *supplied*, in this precedence
+    order — load state, selector, text, URL, JS predicate, then DOM/network
+    stability. These are not raced alternatives; if the chosen condition is not
+    met before the timeout, the wait fails. Supply just the condition that
+    actually gates the content you need.
+    """
+
+    selector: Optional[str] = Field(default=None, description="CSS selector to wait for")
+    text: Optional[str] = Field(default=None, description="Text to wait for")
+    url_contains: Optional[str] = Field(default=None, description="URL fragment to wait for")
+    url_regex: Optional[str] = Field(
+        default=None, description="Regex pattern the URL must match"
+    )
+    js_predicate: Optional[str] = Field(
+        default=None,
+        max_length=2000,
+        description="Boolean-returning JavaScript expression; executed in page context",
+    )
+    load_state: Optional[WaitUntil] = Field(
+        default=None, description="Playwright load state to wait for"
+    )
+    dom_stable_ms: Optional[int] = Field(
+        default=None,
+        ge=100,
+        le=30000,
+        description="Wait until DOM mutations are quiet for this many milliseconds",
+    )
+    network_quiet_ms: Optional[int] = Field(
+        default=None,
+        ge=100,
+        le=30000,
+        description="Wait until network is quiet for this many milliseconds",
+    )
+    timeout: int = Field(
+        default=30000, ge=1000, le=300000, description="Timeout in milliseconds"
+    )
+
+
 class NavigateRequest(BaseModel):
     """Request model for navigation"""
 
-    session_id: str = Field(..., description="Session ID")
-    url: HttpUrl = Field(..., description="URL to navigate to")
+    model_config = ConfigDict(frozen=True)
+
+    session_id: SessionId = Field(..., description="Session ID")
+    url: WebUrl = Field(..., description="URL to navigate to")
     wait_until: WaitUntil = Field(
         default=WaitUntil.DOMCONTENTLOADED, description="Wait condition"
     )
     timeout: Optional[int] = Field(
         default=None, ge=1000, le=300000, description="Timeout in milliseconds"
     )
-
-    @validator("session_id")
-    def validate_session_id(cls, v: str) -> str:
-        if not v or not v.startswith("sess_"):
-            raise ValueError("Invalid session ID format")
-        return v
+    readiness: Optional[ReadinessSpec] = Field(
+        default=None, description="Optional readiness conditions"
+    )
 
 
 class ExtractRequest(BaseModel):
     """Request model for content extraction"""
 
-    session_id: str = Field(..., description="Session ID")
+    model_config = ConfigDict(frozen=True)
+
+    session_id: SessionId = Field(..., description="Session ID")
     extract_type: ExtractType = Field(..., description="Type of content to extract")
     selector: Optional[str] = Field(
         default=None, max_length=1000, description="CSS selector"
@@ -227,12 +289,6 @@ class ExtractRequest(BaseModel):
         default=None, ge=1000, le=60000, description="Timeout in milliseconds"
     )
 
-    @validator("session_id")
-    def validate_session_id(cls, v: str) -> str:
-        if not v or not v.startswith("sess_"):
-            raise ValueError("Invalid session ID format")
-        return v
-
 
 class InteractionOptions(BaseModel):
     """Strictly typed interaction behavior flags."""
@@ -246,11 +302,13 @@ class InteractionOptions(BaseModel):
 class InteractRequest(BaseModel):
     """Request model for element interaction"""
 
-    session_id: str = Field(..., description="Session ID")
+    model_config = ConfigDict(frozen=True)
+
+    session_id: SessionId = Field(..., description="Session ID")
     action: InteractionAction = Field(..., description="Action to perform")
     handle: Optional[str] = Field(default=None, max_length=200, description="Verified SURF element handle")
     selector: Optional[str] = Field(
-        default=None, max_length=1000,
+        default=None, max_length=1000, validate_default=True,
         description="Deprecated selector-only target; prefer a verified handle (supported until migration step 8)",
     )
     contract_version: Optional[str] = Field(
@@ -269,28 +327,25 @@ class InteractRequest(BaseModel):
         default=None, ge=1000, le=60000, description="Timeout in milliseconds"
     )
 
-    @validator("session_id")
-    def validate_session_id(cls, v: str) -> str:
-        if not v or not v.startswith("sess_"):
-            raise ValueError("Invalid session ID format")
-        return v
-
-    @validator("value")
+    @field_validator("value")
+    @classmethod
     def validate_value_for_action(
-        cls, v: Optional[str], values: Dict[str, Any]
+        cls, v: Optional[str], info: ValidationInfo
     ) -> Optional[str]:
-        action = values.get("action")
+        action = info.data.get("action")
         if action in ["type", "select"] and not v:
             raise ValueError(f"Value is required for action '{action}'")
         return v
 
-    @validator("selector", always=True)
-    def validate_target(cls, v: Optional[str], values: Dict[str, Any]) -> Optional[str]:
-        if not v and not values.get("handle"):
+    @field_validator("selector")
+    @classmethod
+    def validate_target(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
+        if not v and not info.data.get("handle"):
             raise ValueError("Either selector or handle is required")
         return v
 
-    @validator("contract_version")
+    @field_validator("contract_version")
+    @classmethod
     def validate_contract_version(cls, v: Optional[str]) -> Optional[str]:
         if v is not None and v != "interaction.v1":
             raise ValueError("Unsupported interaction contract version")
@@ -300,21 +355,16 @@ class InteractRequest(BaseModel):
 class KeyPressRequest(BaseModel):
     """Bounded raw keyboard input, optionally focused on one verified target."""
 
-    session_id: str = Field(..., description="Session ID")
+    session_id: SessionId = Field(..., description="Session ID")
     key: str = Field(..., min_length=1, max_length=100, description="Playwright key chord")
     handle: Optional[str] = Field(default=None, max_length=200)
-    selector: Optional[str] = Field(default=None, max_length=1000)
+    selector: Optional[str] = Field(default=None, max_length=1000, validate_default=True)
     timeout: int = Field(default=30000, ge=100, le=60000)
 
-    @validator("session_id")
-    def validate_session_id(cls, v: str) -> str:
-        if not v or not v.startswith("sess_"):
-            raise ValueError("Invalid session ID format")
-        return v
-
-    @validator("selector", always=True)
-    def validate_target_union(cls, v: Optional[str], values: Dict[str, Any]) -> Optional[str]:
-        if v and values.get("handle"):
+    @field_validator("selector")
+    @classmethod
+    def validate_target_union(cls, v: Optional[str], info: ValidationInfo) -> Optional[str]:
+        if v and info.data.get("handle"):
             raise ValueError("Provide at most one of selector or handle")
         return v
 
@@ -322,37 +372,27 @@ class KeyPressRequest(BaseModel):
 class ConsoleCaptureRequest(BaseModel):
     """Manage bounded console capture for the active page."""
 
-    session_id: str = Field(..., description="Session ID")
+    session_id: SessionId = Field(..., description="Session ID")
     action: str = Field(default="read", pattern="^(start|read|clear|stop)$")
     limit: int = Field(default=100, ge=1, le=1000)
     clear_after_read: bool = False
 
-    @validator("session_id")
-    def validate_session_id(cls, v: str) -> str:
-        if not v or not v.startswith("sess_"):
-            raise ValueError("Invalid session ID format")
-        return v
-
 
 class ViewportResizeRequest(BaseModel):
     """Resize the active page viewport without replacing its context."""
 
-    session_id: str = Field(..., description="Session ID")
+    session_id: SessionId = Field(..., description="Session ID")
     width: int = Field(..., ge=100, le=4096)
     height: int = Field(..., ge=100, le=4096)
     timeout: int = Field(default=30000, ge=100, le=60000)
 
-    @validator("session_id")
-    def validate_session_id(cls, v: str) -> str:
-        if not v or not v.startswith("sess_"):
-            raise ValueError("Invalid session ID format")
-        return v
-
 
 class ScreenshotRequest(BaseModel):
     """Request model for screenshot capture"""
 
-    session_id: str = Field(..., description="Session ID")
+    model_config = ConfigDict(frozen=True)
+
+    session_id: SessionId = Field(..., description="Session ID")
     selector: Optional[str] = Field(
         default=None, max_length=1000, description="CSS selector for element screenshot"
     )
@@ -363,15 +403,19 @@ class ScreenshotRequest(BaseModel):
     quality: Optional[int] = Field(
         default=None, ge=1, le=100, description="JPEG quality (1-100)"
     )
+    format: Optional[ScreenshotFormat] = Field(
+        default=None,
+        description="Image format; jpeg when quality is set, otherwise png",
+    )
     timeout: Optional[int] = Field(
         default=None, ge=1000, le=60000, description="Timeout in milliseconds"
     )
 
-    @validator("session_id")
-    def validate_session_id(cls, v: str) -> str:
-        if not v or not v.startswith("sess_"):
-            raise ValueError("Invalid session ID format")
-        return v
+    @model_validator(mode="after")
+    def validate_format_quality(self) -> "ScreenshotRequest":
+        if self.format is ScreenshotFormat.PNG and self.quality is not None:
+            raise ValueError("quality only applies to jpeg screenshots")
+        return self
 
 
 class ObserveRequest(BaseModel):
@@ -423,47 +467,6 @@ class LocatorSpec(BaseModel):
     )
 
 
-class ReadinessSpec(BaseModel):
-    """Page readiness conditions for dynamic/SPA content.
-
-    Only one condition is used: the first one *supplied*, in this precedence
-    order — load state, selector, text, URL, JS predicate, then DOM/network
-    stability. These are not raced alternatives; if the chosen condition is not
-    met before the timeout, the wait fails. Supply just the condition that
-    actually gates the content you need.
-    """
-
-    selector: Optional[str] = Field(default=None, description="CSS selector to wait for")
-    text: Optional[str] = Field(default=None, description="Text to wait for")
-    url_contains: Optional[str] = Field(default=None, description="URL fragment to wait for")
-    url_regex: Optional[str] = Field(
-        default=None, description="Regex pattern the URL must match"
-    )
-    js_predicate: Optional[str] = Field(
-        default=None,
-        max_length=2000,
-        description="Boolean-returning JavaScript expression; executed in page context",
-    )
-    load_state: Optional[WaitUntil] = Field(
-        default=None, description="Playwright load state to wait for"
-    )
-    dom_stable_ms: Optional[int] = Field(
-        default=None,
-        ge=100,
-        le=30000,
-        description="Wait until DOM mutations are quiet for this many milliseconds",
-    )
-    network_quiet_ms: Optional[int] = Field(
-        default=None,
-        ge=100,
-        le=30000,
-        description="Wait until network is quiet for this many milliseconds",
-    )
-    timeout: int = Field(
-        default=30000, ge=1000, le=300000, description="Timeout in milliseconds"
-    )
-
-
 class WaitRequest(BaseModel):
     """Request model for explicit browser waits"""
 
@@ -532,7 +535,7 @@ class FetchRequest(BaseModel):
     """Request model for one-off HTTP fetches"""
 
     method: str = Field(default="GET", max_length=16, description="HTTP method")
-    url: HttpUrl = Field(..., description="URL to fetch")
+    url: WebUrl = Field(..., description="URL to fetch")
     headers: Optional[Dict[str, str]] = Field(
         default=None, description="Request headers"
     )
@@ -570,8 +573,7 @@ class FetchRequest(BaseModel):
         default=False, description="Overwrite an existing file in output_dir"
     )
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class SessionTouchRequest(BaseModel):
@@ -620,7 +622,7 @@ class BatchRequest(BaseModel):
     operations: List[Dict[str, Any]] = Field(
         ..., min_length=1, max_length=10, description="List of operations"
     )
-    session_id: str = Field(..., description="Session ID for batch operations")
+    session_id: SessionId = Field(..., description="Session ID for batch operations")
     parallel: bool = Field(
         default=False, description="Whether to execute operations in parallel"
     )
@@ -628,17 +630,11 @@ class BatchRequest(BaseModel):
         default=3, ge=1, le=10, description="Maximum concurrent operations"
     )
 
-    @validator("session_id")
-    def validate_session_id(cls, v: str) -> str:
-        if not v or not v.startswith("sess_"):
-            raise ValueError("Invalid session ID format")
-        return v
-
 
 class BrowseRequest(BaseModel):
     """Request model for one-shot browse workflow."""
 
-    url: HttpUrl = Field(..., description="URL to browse")
+    url: WebUrl = Field(..., description="URL to browse")
     mode: str = Field(
         default="standard",
         max_length=64,
@@ -678,11 +674,13 @@ class BrowseRequest(BaseModel):
 class ScrollRequest(BaseModel):
     """Request model for bounded page or element scrolling."""
 
-    session_id: str = Field(..., description="Session ID")
+    session_id: SessionId = Field(..., description="Session ID")
     selector: Optional[str] = Field(
         default=None, max_length=1000, description="Element to scroll into view"
     )
-    direction: str = Field(default="down", description="Scroll direction: up or down")
+    direction: Annotated[str, StringConstraints(to_lower=True, pattern=r"(?i)^(up|down)$")] = Field(
+        default="down", description="Scroll direction: up or down"
+    )
     amount: Optional[int] = Field(
         default=None, description="Pixels to scroll; defaults to 80% of viewport height"
     )
@@ -702,19 +700,6 @@ class ScrollRequest(BaseModel):
         default=None, ge=1000, le=300000, description="Timeout in milliseconds"
     )
 
-    @validator("session_id")
-    def validate_session_id(cls, v: str) -> str:
-        if not v or not v.startswith("sess_"):
-            raise ValueError("Invalid session ID format")
-        return v
-
-    @validator("direction")
-    def validate_direction(cls, v: str) -> str:
-        v = v.lower()
-        if v not in {"up", "down"}:
-            raise ValueError("direction must be 'up' or 'down'")
-        return v
-
 
 # ============================================================================
 # RESPONSE SCHEMAS
@@ -726,7 +711,7 @@ class BaseResponse(BaseModel):
 
     success: bool = Field(..., description="Operation success status")
     timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="Response timestamp"
+        default_factory=lambda: datetime.now(timezone.utc), description="Response timestamp"
     )
     request_id: Optional[str] = Field(
         default=None, description="Request ID for tracing"
@@ -739,8 +724,8 @@ class ErrorResponse(BaseResponse):
     success: bool = Field(default=False, description="Always false for errors")
     error: Dict[str, Any] = Field(..., description="Error details")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": False,
                 "timestamp": "2024-01-01T00:00:00Z",
@@ -751,7 +736,8 @@ class ErrorResponse(BaseResponse):
                     "details": {"session_id": "sess_123"},
                 },
             }
-        }
+        },
+    )
 
 
 class SessionResponse(BaseResponse):
@@ -766,8 +752,8 @@ class SessionResponse(BaseResponse):
         default=None, description="Session expiration time"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "timestamp": "2024-01-01T00:00:00Z",
@@ -780,7 +766,8 @@ class SessionResponse(BaseResponse):
                 },
                 "expires_at": "2024-01-01T00:05:00Z",
             }
-        }
+        },
+    )
 
 
 class NavigationResponse(BaseResponse):
@@ -789,8 +776,8 @@ class NavigationResponse(BaseResponse):
     success: bool = Field(default=True, description="Navigation success status")
     data: Dict[str, Any] = Field(..., description="Navigation result data")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "timestamp": "2024-01-01T00:00:00Z",
@@ -802,7 +789,8 @@ class NavigationResponse(BaseResponse):
                     "duration_ms": 1500,
                 },
             }
-        }
+        },
+    )
 
 
 class ExtractResponse(BaseResponse):
@@ -811,8 +799,8 @@ class ExtractResponse(BaseResponse):
     success: bool = Field(default=True, description="Extraction success status")
     data: Dict[str, Any] = Field(..., description="Extracted content data")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "timestamp": "2024-01-01T00:00:00Z",
@@ -823,7 +811,8 @@ class ExtractResponse(BaseResponse):
                     "type": "text",
                 },
             }
-        }
+        },
+    )
 
 
 class InteractResponse(BaseResponse):
@@ -832,8 +821,8 @@ class InteractResponse(BaseResponse):
     success: bool = Field(default=True, description="Interaction success status")
     data: Dict[str, Any] = Field(..., description="Interaction result data")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "timestamp": "2024-01-01T00:00:00Z",
@@ -844,7 +833,8 @@ class InteractResponse(BaseResponse):
                     "success": True,
                 },
             }
-        }
+        },
+    )
 
 
 class ScreenshotResponse(BaseResponse):
@@ -853,8 +843,8 @@ class ScreenshotResponse(BaseResponse):
     success: bool = Field(default=True, description="Screenshot success status")
     data: Dict[str, Any] = Field(..., description="Screenshot data")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "timestamp": "2024-01-01T00:00:00Z",
@@ -866,7 +856,8 @@ class ScreenshotResponse(BaseResponse):
                     "size_bytes": 125000,
                 },
             }
-        }
+        },
+    )
 
 
 class ObserveResponse(BaseResponse):
@@ -919,8 +910,8 @@ class HealthResponse(BaseResponse):
         default=None, description="Memory usage statistics"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "timestamp": "2024-01-01T00:00:00Z",
@@ -936,7 +927,8 @@ class HealthResponse(BaseResponse):
                     "heap_total": 50000000,
                 },
             }
-        }
+        },
+    )
 
 
 class BatchResponse(BaseResponse):
@@ -952,8 +944,8 @@ class BatchResponse(BaseResponse):
     )
     failed_operations: int = Field(..., description="Number of failed operations")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        json_schema_extra={
             "example": {
                 "success": True,
                 "timestamp": "2024-01-01T00:00:00Z",
@@ -966,7 +958,8 @@ class BatchResponse(BaseResponse):
                 "successful_operations": 2,
                 "failed_operations": 0,
             }
-        }
+        },
+    )
 
 
 class TransitionResult(BaseModel):
@@ -1069,8 +1062,7 @@ class SessionConfig(BaseModel):
         default=None, description="Proxy server options for the context"
     )
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
 class BrowserContext(BaseModel):
@@ -1098,26 +1090,32 @@ class BrowserContext(BaseModel):
         default=None, description="Reason the session was closed or marked expired"
     )
 
-    class Config:
-        use_enum_values = True
+    model_config = ConfigDict(use_enum_values=True)
 
 
-class SessionStats(BaseModel):
-    """Session statistics model"""
+@dataclass(slots=True)
+class SessionStats:
+    """Session statistics, mutated on every operation and never validated as input"""
 
-    requests_made: int = Field(default=0, description="Number of requests made")
-    pages_loaded: int = Field(default=0, description="Number of pages loaded")
-    screenshots_taken: int = Field(default=0, description="Number of screenshots taken")
-    interactions_performed: int = Field(
-        default=0, description="Number of interactions performed"
-    )
-    errors_encountered: int = Field(
-        default=0, description="Number of errors encountered"
-    )
-    total_duration: float = Field(
-        default=0.0, description="Total session duration in seconds"
-    )
-    last_error: Optional[str] = Field(default=None, description="Last error message")
+    requests_made: int = 0
+    pages_loaded: int = 0
+    screenshots_taken: int = 0
+    interactions_performed: int = 0
+    errors_encountered: int = 0
+    total_duration: float = 0.0
+    last_error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the counters as a plain dict"""
+        return {
+            "requests_made": self.requests_made,
+            "pages_loaded": self.pages_loaded,
+            "screenshots_taken": self.screenshots_taken,
+            "interactions_performed": self.interactions_performed,
+            "errors_encountered": self.errors_encountered,
+            "total_duration": self.total_duration,
+            "last_error": self.last_error,
+        }
 
     def increment_requests(self) -> None:
         """Increment request counter"""
@@ -1174,25 +1172,38 @@ class SessionData(BaseModel):
     active_page_id: Optional[str] = Field(
         default=None, exclude=True, description="Currently active page id"
     )
+    expires_at_ts: Optional[float] = Field(
+        default=None, exclude=True, description="Hard expiration as a Unix timestamp"
+    )
 
-    class Config:
-        use_enum_values = True
-        arbitrary_types_allowed = True
+    model_config = ConfigDict(use_enum_values=True, arbitrary_types_allowed=True)
 
 
-class SessionMetrics(BaseModel):
+@dataclass(slots=True)
+class SessionMetrics:
     """Session performance metrics"""
 
-    average_page_load_time: float = Field(
-        default=0.0, description="Average page load time in seconds"
-    )
-    average_response_time: float = Field(
-        default=0.0, description="Average response time in seconds"
-    )
-    memory_usage: int = Field(default=0, description="Memory usage in bytes")
-    cpu_usage: float = Field(default=0.0, description="CPU usage percentage")
-    network_requests: int = Field(default=0, description="Total network requests")
-    data_transferred: int = Field(default=0, description="Data transferred in bytes")
+    average_page_load_time: float = 0.0
+    average_response_time: float = 0.0
+    memory_usage: int = 0
+    cpu_usage: float = 0.0
+    network_requests: int = 0
+    data_transferred: int = 0
+    total_page_load_time: float = 0.0
+    total_response_time: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the metrics as a plain dict"""
+        return {
+            "average_page_load_time": self.average_page_load_time,
+            "average_response_time": self.average_response_time,
+            "memory_usage": self.memory_usage,
+            "cpu_usage": self.cpu_usage,
+            "network_requests": self.network_requests,
+            "data_transferred": self.data_transferred,
+            "total_page_load_time": self.total_page_load_time,
+            "total_response_time": self.total_response_time,
+        }
 
     def calculate_averages(self, total_operations: int) -> None:
         """Calculate average metrics"""
@@ -1202,14 +1213,10 @@ class SessionMetrics(BaseModel):
 
     def add_page_load_time(self, load_time: float) -> None:
         """Add page load time to totals"""
-        if not hasattr(self, "total_page_load_time"):
-            self.total_page_load_time = 0.0
         self.total_page_load_time += load_time
 
     def add_response_time(self, response_time: float) -> None:
         """Add response time to totals"""
-        if not hasattr(self, "total_response_time"):
-            self.total_response_time = 0.0
         self.total_response_time += response_time
 
 
@@ -1295,7 +1302,7 @@ class SearchRequest(BaseModel):
 class SearchExtractRequest(BaseModel):
     """Request model for parallel deep content extraction"""
 
-    urls: List[HttpUrl] = Field(..., min_length=1, max_length=10)
+    urls: List[WebUrl] = Field(..., min_length=1, max_length=10)
     content_mode: str = Field(default="reader")
     max_text_length: int = Field(default=8000, ge=500, le=50000)
     relevance: Optional[Dict[str, float]] = Field(
@@ -1312,7 +1319,7 @@ class SearchExtractRequest(BaseModel):
 class YoutubeTranscriptRequest(BaseModel):
     """Request one normalized transcript from a public YouTube video."""
 
-    url: HttpUrl = Field(..., description="Single YouTube video URL")
+    url: WebUrl = Field(..., description="Single YouTube video URL")
     languages: Optional[List[str]] = Field(
         default=None,
         max_length=10,
@@ -77,14 +77,11 @@ def apply_env_overrides(args: argparse.Namespace) -> None:
 
 
 def _reload_settings() -> None:
-    from config.settings import get_settings
-
-    get_settings.cache_clear()
     import config.settings as settings_mod
     import services.challenge_resolver as challenge_mod
     import services.search_service as search_mod
 
-    settings_mod.settings = get_settings()
+    settings_mod.settings = settings_mod.Settings()
     challenge_mod.settings = settings_mod.settings
     search_mod.settings = settings_mod.settings
 
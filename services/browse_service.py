@@ -6,6 +6,7 @@ screenshot, and closes the session unless the caller asks to keep it alive.
 """
 from __future__ import annotations
 
+import asyncio
 import time
 from typing import Any, Dict, Optional
 
@@ -153,7 +154,8 @@ class BrowseService:
             if document_body:
                 if extract_download:
                     extract_service = await self._document_extract_service()
-                    extract = extract_service.extract_from_bytes(
+                    extract = await asyncio.to_thread(
+                        extract_service.extract_from_bytes,
                         document_body,
                         filename=url.rsplit("/", 1)[-1].split("?")[0] or "download.bin",
                         content_type=nav_result.get("content_type"),
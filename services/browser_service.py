@@ -1597,8 +1597,14 @@ class BrowserService:
         timeout: Optional[int] = None,
         path: Optional[str] = None,
         quality: Optional[int] = None,
+        image_format: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Capture a viewport, full-page, or element screenshot and register it as an artifact."""
+        """Capture a viewport, full-page, or element screenshot and register it as an artifact.
+
+        JPEG output (``image_format="jpeg"``, implied by ``quality``) is
+        encoded by the browser itself and is typically several times smaller
+        than the lossless PNG default.
+        """
 
         if not self.initialized:
             raise BrowserOperationError("screenshot", "Browser service not initialized")
@@ -1635,6 +1641,15 @@ class BrowserService:
             # Quick delay before screenshot
             await asyncio.sleep(random.uniform(0.2, 0.8))
 
+            image_format = getattr(image_format, "value", image_format)
+            if image_format is None:
+                # Playwright requires jpeg type when quality is set.
+                image_format = "jpeg" if quality is not None else "png"
+            if image_format not in {"png", "jpeg"}:
+                raise BrowserOperationError("screenshot", f"Unsupported image format: {image_format}")
+            if image_format == "png" and quality is not None:
+                raise BrowserOperationError("screenshot", "quality only applies to jpeg screenshots")
+
             # Generate path if not provided
             if not path:
                 timestamp = int(time.time())
@@ -1642,10 +1657,10 @@ class BrowserService:
             path = str(resolve_export_file(path, default_root="screenshots_dir"))
 
             screenshot_options: Dict[str, Any] = {"path": path, "full_page": full_page}
-            if quality is not None:
-                # Playwright requires jpeg type when quality is set.
+            if image_format == "jpeg":
                 screenshot_options["type"] = "jpeg"
-                screenshot_options["quality"] = quality
+                if quality is not None:
+                    screenshot_options["quality"] = quality
                 if Path(path).suffix.lower() not in {".jpg", ".jpeg"}:
                     path = str(Path(path).with_suffix(".jpg"))
                     screenshot_options["path"] = path
@@ -1846,7 +1861,7 @@ class BrowserService:
                     if text and len(text.strip()) > 10:  # Lower threshold for better results
                         break
                 except Exception as e:
-                    logger.debug(f"Selector {sel} failed: {e}")
+                    logger.debug("Selector failed", selector=sel, error=str(e))
                     continue
         
         # Fallback to page content if no selector worked
@@ -1854,7 +1869,7 @@ class BrowserService:
             try:
                 text = await page.locator('body').text_content()
             except Exception as e:
-                logger.warning(f"Fallback text extraction failed: {e}")
+                logger.warning("Fallback text extraction failed", error=str(e))
                 text = ""
         
         return {
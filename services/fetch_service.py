@@ -56,7 +56,8 @@ class FetchService:
             result["duration_ms"] = int((time.time() - started) * 1000)
             result["warnings"] = self._response_warnings(result.get("status"))
             if extract_documents:
-                result = self._maybe_extract_document(result)
+                # pypdf/docx/openpyxl parsing is CPU-bound; keep it off the loop.
+                result = await asyncio.to_thread(self._maybe_extract_document, result)
             return result
         except (OutboundPolicyError, ResourceLimitError):
             raise
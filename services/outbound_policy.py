@@ -22,6 +22,8 @@ from core.foundation import SurfException
 class OutboundPolicyError(SurfException):
     """Raised when an outbound URL violates the configured egress policy."""
 
+    __slots__ = ()
+
     def __init__(self, message: str):
         super().__init__(message, error_code="OUTBOUND_TARGET_BLOCKED")
 
@@ -29,6 +31,8 @@ class OutboundPolicyError(SurfException):
 class OutboundResolutionError(OutboundPolicyError):
     """Raised when a permitted hostname cannot be resolved to any address."""
 
+    __slots__ = ()
+
     def __init__(self, message: str):
         SurfException.__init__(self, message, error_code="OUTBOUND_DNS_RESOLUTION_FAILED")
 
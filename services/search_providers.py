@@ -18,12 +18,21 @@ from utils.text import clean_text as _clean_text
 logger = structlog.get_logger()
 settings = get_settings()
 
+# Keep-alive pool for each provider's client; searches fan out to at most a
+# couple of concurrent calls per provider, so a small pool is plenty.
+_PROVIDER_POOL_LIMITS = httpx.Limits(
+    max_connections=20,
+    max_keepalive_connections=10,
+    keepalive_expiry=30.0,
+)
+
 
 async def _bounded_json_request(
     method: str,
     url: str,
     *,
     timeout: float,
+    client: Optional[httpx.AsyncClient] = None,
     **request_kwargs: Any,
 ) -> Dict[str, Any]:
     """Read provider JSON incrementally under the configured parse budget.
@@ -32,39 +41,67 @@ async def _bounded_json_request(
     Do not rebuild an ``httpx.Response`` with the original encoding headers —
     that re-applies gzip/deflate to already-decoded bytes and breaks Exa
     (Content-Encoding: gzip + chunked).
+
+    Pass ``client`` to reuse a pooled keep-alive connection; without one a
+    throwaway client is opened for this request only.
     """
+    if client is None:
+        async with httpx.AsyncClient(timeout=timeout) as ephemeral:
+            return await _read_bounded_json(ephemeral, method, url, timeout, request_kwargs)
+    return await _read_bounded_json(client, method, url, timeout, request_kwargs)
+
+
+async def _read_bounded_json(
+    client: httpx.AsyncClient,
+    method: str,
+    url: str,
+    timeout: float,
+    request_kwargs: Dict[str, Any],
+) -> Dict[str, Any]:
     limit = get_settings().max_json_parse_size
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        async with client.stream(method, url, **request_kwargs) as response:
-            declared = response.headers.get("content-length")
-            if declared:
-                try:
-                    declared_size = int(declared)
-                except ValueError:
-                    declared_size = 0
-                if declared_size > limit:
-                    raise ResourceLimitError("provider_response_bytes", limit, declared_size)
-
-            content = bytearray()
-            async for chunk in response.aiter_bytes():
-                projected = len(content) + len(chunk)
-                if projected > limit:
-                    raise ResourceLimitError("provider_response_bytes", limit, projected)
-                content.extend(chunk)
-
-            # raise_for_status on the stream response after the body is read so
-            # HTTPStatusError can still expose response content when needed.
-            response.raise_for_status()
-            data = json.loads(bytes(content))
-            if not isinstance(data, dict):
-                raise ValueError("Search provider returned a non-object JSON response")
-            return data
+    async with client.stream(method, url, timeout=timeout, **request_kwargs) as response:
+        declared = response.headers.get("content-length")
+        if declared:
+            try:
+                declared_size = int(declared)
+            except ValueError:
+                declared_size = 0
+            if declared_size > limit:
+                raise ResourceLimitError("provider_response_bytes", limit, declared_size)
+
+        content = bytearray()
+        async for chunk in response.aiter_bytes():
+            projected = len(content) + len(chunk)
+            if projected > limit:
+                raise ResourceLimitError("provider_response_bytes", limit, projected)
+            content.extend(chunk)
+
+        # raise_for_status on the stream response after the body is read so
+        # HTTPStatusError can still expose response content when needed.
+        response.raise_for_status()
+        data = json.loads(bytes(content))
+        if not isinstance(data, dict):
+            raise ValueError("Search provider returned a non-object JSON response")
+        return data
 
 
 class SearchProvider(ABC):
     """Abstract base for a web-search backend."""
 
     name: str = "abstract"
+    _client: Optional[httpx.AsyncClient] = None
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """Return this provider's pooled client, reopening it after ``aclose``."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(limits=_PROVIDER_POOL_LIMITS)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the pooled client and its keep-alive connections."""
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
 
     @abstractmethod
     async def search(
@@ -208,6 +245,7 @@ class ExaSearchProvider(SearchProvider):
                 "POST",
                 f"{self._base_url}/search",
                 timeout=self._timeout,
+                client=self._http_client(),
                 json=payload,
                 headers={
                     "x-api-key": self._api_key,
@@ -382,6 +420,7 @@ class SearXNGSearchProvider(SearchProvider):
             "GET",
             f"{self._base_url}/search",
             timeout=self._timeout,
+            client=self._http_client(),
             params=params,
             headers=headers,
         )
@@ -420,3 +459,7 @@ class SearchProviderRegistry:
         if fallback:
             providers.append(fallback)
         return providers
+
+    async def aclose(self) -> None:
+        for provider in self._providers.values():
+            await provider.aclose()
@@ -176,6 +176,10 @@ class SearchService:
             "avg_extract_ms": 0.0,
         }
 
+    async def cleanup(self) -> None:
+        """Close pooled provider connections."""
+        await self._registry.aclose()
+
     # ---- Stage 1: provider search -----------------------------------------
 
     async def search(
@@ -166,13 +166,14 @@ class SessionService:
                 
                 # Create browser context model
                 now = datetime.now(timezone.utc)
+                expires_at = now + timedelta(seconds=settings.hard_ttl_seconds) if settings.hard_ttl_seconds else None
                 browser_context = BrowserContextModel(
                     context_id=str(id(context)),
                     page_id="",
                     status=SessionStatus.ACTIVE,
                     created_at=now,
                     last_activity=now,
-                    expires_at=now + timedelta(seconds=settings.hard_ttl_seconds) if settings.hard_ttl_seconds else None
+                    expires_at=expires_at
                 )
                 
                 # Create session data
@@ -188,7 +189,8 @@ class SessionService:
                         "blocker": self._new_blocker_stats(config),
                         "pool": pool,
                     },
-                    stats=SessionStats()
+                    stats=SessionStats(),
+                    expires_at_ts=expires_at.timestamp() if expires_at else None
                 )
                 
                 session_data.context_obj = context
@@ -229,7 +231,7 @@ class SessionService:
                     "Session created",
                     session_id=session_id,
                     user_id=user_id,
-                    config=config.dict()
+                    config=config.model_dump()
                 )
                 
                 return session_data
@@ -294,8 +296,8 @@ class SessionService:
         
         session = self.active_sessions[session_id]
         
-        now = datetime.now(timezone.utc)
-        if self._hard_expired(session, now):
+        # Compared as a float so the expiry check allocates no datetime
+        if session.expires_at_ts is not None and time.time() > session.expires_at_ts:
             await self._close_session_internal(session_id, "hard_ttl_expired")
             raise InvalidSessionError(session_id, "Session hard TTL expired")
         
@@ -307,7 +309,7 @@ class SessionService:
         
         # Update last activity
         if touch:
-            session.context.last_activity = now
+            session.context.last_activity = datetime.now(timezone.utc)
             session.context.status = SessionStatus.ACTIVE
         
         return session
@@ -365,36 +367,42 @@ class SessionService:
     
     async def update_session_stats(self, session_id: str, stats_update: Dict[str, Any]) -> None:
         """Update session statistics"""
-        if session_id not in self.active_sessions:
+        await self.update_session_stats_bulk(session_id, [stats_update])
+    
+    async def update_session_stats_bulk(self, session_id: str, stats_updates: List[Dict[str, Any]]) -> None:
+        """Fold the statistics of several operations into the session in one pass"""
+        session = self.active_sessions.get(session_id)
+        if session is None:
             return
         
-        session = self.active_sessions[session_id]
-        
-        # Update stats based on operation type
-        if stats_update.get("operation") == "navigate":
-            session.stats.increment_pages()
-        elif stats_update.get("operation") == "screenshot":
-            session.stats.increment_screenshots()
-        elif stats_update.get("operation") == "interact":
-            session.stats.increment_interactions()
-        elif stats_update.get("operation") == "request":
-            session.stats.increment_requests()
-        
-        # Update duration
-        if "duration" in stats_update:
-            session.stats.update_duration(stats_update["duration"])
-        
-        # Update error count
-        if "error" in stats_update:
-            session.stats.increment_errors(stats_update["error"])
+        stats = session.stats
+        for stats_update in stats_updates:
+            # Update stats based on operation type
+            operation = stats_update.get("operation")
+            if operation == "navigate":
+                stats.increment_pages()
+            elif operation == "screenshot":
+                stats.increment_screenshots()
+            elif operation == "interact":
+                stats.increment_interactions()
+            elif operation == "request":
+                stats.increment_requests()
+            
+            # Update duration
+            if "duration" in stats_update:
+                stats.update_duration(stats_update["duration"])
+            
+            # Update error count
+            if "error" in stats_update:
+                stats.increment_errors(stats_update["error"])
     
     async def get_session_stats(self, session_id: str) -> Dict[str, Any]:
         """Get session statistics"""
         session = await self.get_session(session_id)
         return {
             "session_id": session_id,
-            "stats": session.stats.dict(),
-            "context": session.context.dict(),
+            "stats": session.stats.to_dict(),
+            "context": session.context.model_dump(),
             "uptime": time.time() - session.context.created_at.timestamp(),
             "monitor": self._session_monitor_entry(session, time.time())
         }
@@ -402,6 +410,7 @@ class SessionService:
     async def list_sessions(self, user_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """List all active sessions"""
         sessions = []
+        now = time.time()
         
         for session_id, session in self.active_sessions.items():
             if user_id and session.metadata.get("user_id") != user_id:
@@ -412,13 +421,13 @@ class SessionService:
                 "status": session.context.status,
                 "created_at": session.context.created_at,
                 "last_activity": session.context.last_activity,
-                "idle_for_seconds": self._idle_for(session, time.time()),
+                "idle_for_seconds": self._idle_for(session, now),
                 "busy_operations": session.metadata.get("busy_operations", 0),
                 "url": session.context.url,
                 "title": session.context.title,
                 "blocker": session.metadata.get("blocker", {}),
                 "last_navigation_blocker": session.metadata.get("last_navigation_blocker", {}),
-                "stats": session.stats.dict()
+                "stats": session.stats.to_dict()
             })
 
         return sessions
@@ -904,9 +913,6 @@ class SessionService:
             return "idle_timeout"
         return None
 
-    def _hard_expired(self, session: SessionData, now: datetime) -> bool:
-        return bool(session.context.expires_at and now > session.context.expires_at)
-
     def _idle_for(self, session: SessionData, now: float) -> float:
         return max(0.0, now - session.context.last_activity.timestamp())
 
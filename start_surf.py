@@ -43,5 +43,10 @@ if __name__ == "__main__":
         host=settings.host,
         port=port,
         reload=settings.debug,
-        log_level=settings.log_level.lower()
+        log_level=settings.log_level.lower(),
+        # One worker: sessions, the browser pool and rate limits live in
+        # this process. HTTP only, so skip websocket protocol detection.
+        interface="asgi3",
+        ws="none",
+        lifespan="on",
     )
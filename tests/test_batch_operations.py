@@ -4,8 +4,9 @@ from unittest.mock import AsyncMock
 import pytest
 from pydantic import ValidationError
 
-from controllers.browser_controller import _execute_operation
-from models.schemas import BatchRequest, ExtractType, InteractionAction
+from controllers.browser_controller import _batch_stats_updates, _execute_operation
+from models.schemas import BatchRequest, ExtractType, InteractionAction, SessionMetrics, SessionStats, WaitUntil
+from services.session_service import SessionService
 
 
 def test_batch_request_caps_operation_count():
@@ -45,3 +46,76 @@ async def test_batch_interaction_converts_string_to_enum():
         browser.interact_with_element.await_args.kwargs["action"]
         is InteractionAction.CLICK
     )
+
+
+@pytest.mark.asyncio
+async def test_batch_navigate_converts_wait_until_and_rejects_unknown_types():
+    browser = AsyncMock()
+    browser.navigate_to_url.return_value = {"url": "https://example.com"}
+
+    result = await _execute_operation(
+        {"type": "navigate", "url": "https://example.com", "wait_until": "load"},
+        object(),
+        browser,
+    )
+    assert result["success"] is True
+    assert browser.navigate_to_url.await_args.kwargs["wait_until"] is WaitUntil.LOAD
+
+    unknown = await _execute_operation({"type": "teleport"}, object(), browser)
+    assert unknown["success"] is False
+    assert unknown["data"] == {"error": "Unknown operation type: teleport"}
+
+
+@pytest.mark.asyncio
+async def test_batch_stats_are_folded_in_one_update():
+    results = [
+        {"operation": "navigate", "success": True, "data": {"duration_ms": 1500}},
+        {"operation": "screenshot", "success": True, "data": {}},
+        {"operation": "interact", "success": False, "error": "boom"},
+    ]
+    updates = _batch_stats_updates(results)
+    assert updates == [
+        {"operation": "navigate", "duration": 1.5},
+        {"operation": "screenshot"},
+    ]
+
+    service = SessionService()
+    session = type("Session", (), {"stats": SessionStats()})()
+    service.active_sessions["sess_12345678"] = session
+    await service.update_session_stats_bulk("sess_12345678", updates)
+
+    assert session.stats.pages_loaded == 1
+    assert session.stats.screenshots_taken == 1
+    assert session.stats.interactions_performed == 0
+    assert session.stats.total_duration == 1.5
+
+
+def test_session_stats_are_slotted_and_serialize_to_plain_dict():
+    stats = SessionStats()
+    stats.increment_errors("boom")
+
+    assert not hasattr(stats, "__dict__")
+    assert stats.to_dict() == {
+        "requests_made": 0,
+        "pages_loaded": 0,
+        "screenshots_taken": 0,
+        "interactions_performed": 0,
+        "errors_encountered": 1,
+        "total_duration": 0.0,
+        "last_error": "boom",
+    }
+
+
+def test_session_metrics_accumulate_from_declared_totals():
+    metrics = SessionMetrics()
+    metrics.calculate_averages(3)
+    assert metrics.average_page_load_time == 0.0
+
+    metrics.add_page_load_time(1.5)
+    metrics.add_page_load_time(1.5)
+    metrics.add_response_time(0.6)
+    metrics.calculate_averages(3)
+
+    assert metrics.average_page_load_time == 1.0
+    assert metrics.average_response_time == pytest.approx(0.2)
+    assert metrics.to_dict()["total_page_load_time"] == 3.0
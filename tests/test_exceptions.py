@@ -0,0 +1,50 @@
+"""SurfException message formatting tests."""
+import copy
+import pickle
+import types
+
+from core.foundation import CODE_SESSION_NOT_FOUND, SessionNotFoundError, SurfException
+
+
+def test_surf_exception_messages_are_formatted_on_first_read():
+    error = SessionNotFoundError("sess_12345678")
+
+    assert error._message == "Session %s not found"
+    assert error.message == "Session sess_12345678 not found"
+    assert str(error) == error.message
+    assert error.details == {"session_id": "sess_12345678"}
+    assert str(SurfException("100% plain")) == "100% plain"
+
+
+def test_surf_exception_args_repr_and_pickle_use_the_formatted_message():
+    error = SessionNotFoundError("sess_12345678")
+
+    assert error.args == ("Session sess_12345678 not found",)
+    assert repr(error) == "SessionNotFoundError('Session sess_12345678 not found')"
+
+    for restored in (pickle.loads(pickle.dumps(SessionNotFoundError("sess_12345678"))), copy.copy(error)):
+        assert type(restored) is SessionNotFoundError
+        assert str(restored) == "Session sess_12345678 not found"
+        assert restored.error_code == CODE_SESSION_NOT_FOUND
+        assert restored.details == {"session_id": "sess_12345678"}
+
+    error.message = "Session gone"
+    assert str(error) == "Session gone"
+    assert error.args == ("Session gone",)
+
+
+def test_surf_exception_attributes_live_in_slots():
+    error = SessionNotFoundError("sess_12345678")
+    values = {
+        "_message": "Session %s gone",
+        "_message_args": ("sess_87654321",),
+        "_formatted": None,
+        "error_code": "GONE",
+        "details": {"session_id": "sess_87654321"},
+    }
+
+    for name, value in values.items():
+        assert isinstance(getattr(SurfException, name), types.MemberDescriptorType)
+        setattr(error, name, value)
+        assert getattr(error, name) == value
+    assert error.message == "Session sess_87654321 gone"
@@ -0,0 +1,59 @@
+"""Health metrics snapshot caching tests."""
+import pytest
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from controllers import health_controller
+from core.foundation import require_full_access
+
+
+@pytest.mark.asyncio
+async def test_metrics_snapshot_is_shared_within_ttl(monkeypatch):
+    monkeypatch.setattr(health_controller, "_metrics_cache", None)
+    calls = []
+    real_virtual_memory = health_controller.psutil.virtual_memory
+
+    def counting_virtual_memory():
+        calls.append(1)
+        return real_virtual_memory()
+
+    monkeypatch.setattr(health_controller.psutil, "virtual_memory", counting_virtual_memory)
+
+    first = await health_controller.get_metrics(Response(), _user={})
+    second = await health_controller.get_metrics(Response(), _user={})
+    assert first["success"] is True
+    assert second["metrics"] is first["metrics"]
+    assert len(calls) == 1
+
+    monkeypatch.setattr(health_controller, "_metrics_cache", (0.0, {}))
+    third = await health_controller.get_metrics(Response(), _user={})
+    assert third["metrics"] is not first["metrics"]
+    assert len(calls) == 2
+
+
+def test_disk_usage_is_refreshed_on_its_own_interval(monkeypatch):
+    monkeypatch.setattr(health_controller, "_disk_cache", None)
+    calls = []
+    monkeypatch.setattr(
+        health_controller.psutil, "disk_usage", lambda path: calls.append(path) or len(calls)
+    )
+
+    assert health_controller._disk_usage(100.0) == 1
+    assert health_controller._disk_usage(129.0) == 1
+    assert health_controller._disk_usage(130.0) == 2
+    assert calls == ["/", "/"]
+
+
+def test_metrics_payload_round_trips_through_annotated_route(monkeypatch):
+    """The Dict[str, Any] return annotation serializes through pydantic, which
+    rejects values it cannot encode and turns NaN/inf into null."""
+    monkeypatch.setattr(health_controller, "_metrics_cache", None)
+    test_app = FastAPI()
+    test_app.include_router(health_controller.router, prefix="/health")
+    test_app.dependency_overrides[require_full_access] = lambda: {}
+
+    with TestClient(test_app) as client:
+        response = client.get("/health/metrics")
+
+    assert response.status_code == 200
+    assert response.json() == {"success": True, "metrics": health_controller._metrics_cache[1]}
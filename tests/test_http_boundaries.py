@@ -4,11 +4,21 @@ from __future__ import annotations
 import json
 
 import pytest
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.testclient import TestClient
 
 from config import get_settings
-from core.foundation import RateLimitMiddleware, RequestSizeLimitMiddleware, SecurityMiddleware
+from core import foundation
+from core.foundation import (
+    LoggingMiddleware,
+    RateLimitMiddleware,
+    RequestSizeLimitMiddleware,
+    SecurityMiddleware,
+    SessionNotFoundError,
+    SurfException,
+    install_cors,
+    surf_exception_handler,
+)
 
 
 @pytest.mark.asyncio
@@ -96,3 +106,324 @@ def test_health_details_use_profile_keys(monkeypatch):
 
     assert response.status_code == 200
     assert response.json()["browser_runtime"]["status"] == "not_started"
+
+
+def test_middleware_chain_sets_state_headers_and_error_envelope(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "browse_key", "b" * 32)
+    test_app = FastAPI()
+    test_app.add_middleware(SecurityMiddleware)
+    test_app.add_middleware(LoggingMiddleware)
+    test_app.add_exception_handler(SurfException, surf_exception_handler)
+
+    @test_app.get("/browser/state")
+    async def state(request: Request):
+        return {"request_id": request.state.request_id, "profile": request.state.user["profile"]}
+
+    @test_app.get("/browser/missing")
+    async def missing():
+        raise SessionNotFoundError("sess_12345678")
+
+    headers = {"Authorization": f"Bearer {'b' * 32}"}
+    with TestClient(test_app, raise_server_exceptions=False) as client:
+        response = client.get("/browser/state", headers=headers)
+        failed = client.get("/browser/missing", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "request_id": response.headers["x-request-id"],
+        "profile": "browse",
+    }
+    assert len(response.headers["x-request-id"]) == 32
+    assert "-" not in response.headers["x-request-id"]
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert response.headers["x-frame-options"] == "DENY"
+    assert response.headers["x-xss-protection"] == "1; mode=block"
+    assert response.headers["referrer-policy"] == "strict-origin-when-cross-origin"
+    assert failed.status_code == 400
+    assert failed.json()["error"]["code"] == "SESSION_NOT_FOUND"
+    assert "x-request-id" in failed.headers
+
+
+def test_unhandled_route_errors_keep_security_headers_and_request_id(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "browse_key", "b" * 32)
+    completed = []
+    monkeypatch.setattr(foundation.logger, "info", lambda event, **kw: completed.append((event, kw)))
+    test_app = FastAPI()
+    test_app.add_middleware(LoggingMiddleware)
+    test_app.add_middleware(SecurityMiddleware)
+    test_app.add_exception_handler(SurfException, surf_exception_handler)
+
+    @test_app.get("/browser/boom")
+    async def boom():
+        raise RuntimeError("diagnostic must stay hidden")
+
+    # raise_server_exceptions stays on: the error must not reach Starlette's
+    # outermost ServerErrorMiddleware at all.
+    with TestClient(test_app) as client:
+        response = client.get("/browser/boom", headers={"Authorization": f"Bearer {'b' * 32}"})
+
+    assert response.status_code == 500
+    assert response.json() == {
+        "success": False,
+        "error": {"code": "INTERNAL_ERROR", "message": "An unexpected error occurred"},
+    }
+    assert response.headers["x-content-type-options"] == "nosniff"
+    assert response.headers["x-frame-options"] == "DENY"
+    assert response.headers["x-xss-protection"] == "1; mode=block"
+    request_id = response.headers["x-request-id"]
+    assert completed == [
+        ("Request completed", {**completed[0][1], "request_id": request_id, "status_code": 500})
+    ]
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_bucket_refills_over_the_window():
+    async def downstream(_scope, _receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    middleware = RateLimitMiddleware(downstream, requests_per_window=2, window_seconds=60)
+    scope = {"type": "http", "method": "GET", "path": "/limited", "client": ("10.0.0.1", 1), "headers": []}
+
+    async def call():
+        sent = []
+
+        async def send(message):
+            sent.append(message)
+
+        await middleware(scope, None, send)
+        return sent[0]
+
+    assert (await call())["status"] == 200
+    assert (await call())["status"] == 200
+    limited = await call()
+    assert limited["status"] == 429
+    assert (b"retry-after", b"30") in limited["headers"]
+
+    tokens, last_refill = middleware.buckets["10.0.0.1"]
+    middleware.buckets["10.0.0.1"] = (tokens, last_refill - 30)
+    assert (await call())["status"] == 200
+    assert (await call())["status"] == 429
+
+
+@pytest.mark.asyncio
+async def test_rate_limit_evicts_least_recent_clients():
+    async def downstream(_scope, _receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b"ok"})
+
+    async def send(_message):
+        return None
+
+    middleware = RateLimitMiddleware(downstream, requests_per_window=5, max_clients=2)
+    for host in ("10.0.0.1", "10.0.0.2", "10.0.0.1", "10.0.0.3"):
+        scope = {"type": "http", "method": "GET", "path": "/", "client": (host, 1), "headers": []}
+        await middleware(scope, None, send)
+
+    assert list(middleware.buckets) == ["10.0.0.1", "10.0.0.3"]
+
+
+@pytest.mark.asyncio
+async def test_liveness_probes_are_not_request_logged(monkeypatch):
+    from core import foundation
+
+    events = []
+    monkeypatch.setattr(foundation.logger, "info", lambda event, **kw: events.append(event))
+
+    async def downstream(_scope, _receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+
+    async def send(_message):
+        return None
+
+    middleware = LoggingMiddleware(downstream)
+    for path in ("/health/live", "/browser/navigate"):
+        scope = {"type": "http", "method": "GET", "path": path, "client": None, "headers": []}
+        await middleware(scope, None, send)
+
+    assert events == ["Request completed"]
+
+
+@pytest.mark.asyncio
+async def test_logging_middleware_assigns_request_id_even_for_probes():
+    sent = []
+
+    async def downstream(scope, _receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        sent.append(scope["state"]["request_id"])
+
+    async def send(message):
+        sent.append(dict(message["headers"])[b"x-request-id"])
+
+    scope = {"type": "http", "method": "GET", "path": "/health/live", "client": None, "headers": []}
+    await LoggingMiddleware(downstream)(scope, None, send)
+
+    assert sent[0].decode("ascii") == sent[1]
+    assert len(sent[1]) == 32
+
+
+@pytest.mark.asyncio
+async def test_request_logs_are_sampled_but_errors_always_log(monkeypatch):
+    from core import foundation
+
+    monkeypatch.setattr(get_settings(), "request_log_sample_rate", 3)
+    monkeypatch.setattr(foundation, "_request_log_counter", iter(range(100)))
+    statuses = []
+    monkeypatch.setattr(
+        foundation.logger, "info", lambda event, **kw: statuses.append(kw["status_code"])
+    )
+
+    async def send(_message):
+        return None
+
+    for status_code in (200, 200, 200, 500, 200):
+        async def downstream(_scope, _receive, send, status_code=status_code):
+            await send({"type": "http.response.start", "status": status_code, "headers": []})
+
+        scope = {"type": "http", "method": "GET", "path": "/browser/navigate", "client": None, "headers": []}
+        await LoggingMiddleware(downstream)(scope, None, send)
+
+    assert statuses == [200, 500, 200]
+
+
+@pytest.mark.asyncio
+async def test_unhandled_errors_are_answered_and_logged_with_request_id(monkeypatch):
+    from core import foundation
+
+    completed = []
+    failures = []
+    monkeypatch.setattr(foundation.logger, "info", lambda event, **kw: completed.append(kw))
+    monkeypatch.setattr(foundation.logger, "error", lambda event, **kw: failures.append(kw))
+
+    async def downstream(_scope, _receive, _send):
+        raise RuntimeError("diagnostic must stay hidden")
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/browser/navigate", "client": None, "headers": []}
+    await LoggingMiddleware(downstream)(scope, None, send)
+
+    request_id = scope["state"]["request_id"]
+    assert sent[0]["status"] == 500
+    assert dict(sent[0]["headers"])[b"x-request-id"].decode("ascii") == request_id
+    assert json.loads(sent[1]["body"])["error"]["code"] == "INTERNAL_ERROR"
+    assert b"diagnostic" not in sent[1]["body"]
+    assert failures[0]["request_id"] == request_id
+    assert failures[0]["error_type"] == "RuntimeError"
+    assert completed[0]["request_id"] == request_id
+    assert completed[0]["status_code"] == 500
+
+
+@pytest.mark.asyncio
+async def test_errors_after_response_start_are_not_answered_twice():
+    async def downstream(_scope, _receive, send):
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        raise RuntimeError("stream broke")
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/browser/navigate", "client": None, "headers": []}
+    with pytest.raises(RuntimeError):
+        await LoggingMiddleware(downstream)(scope, None, send)
+
+    assert [message["type"] for message in sent] == ["http.response.start"]
+
+
+def test_profile_principals_are_shared_and_read_only(monkeypatch):
+    from core.foundation import _request_principal
+
+    settings = get_settings()
+    monkeypatch.setattr(settings, "browse_key", "b" * 32)
+    keys = settings.profile_keys()
+
+    first, _ = _request_principal(f"Bearer {'b' * 32}", keys)
+    second, _ = _request_principal(f"bearer {'b' * 32}", keys)
+    assert first is second
+    assert first["profile"] == "browse"
+    assert first["scopes"] == frozenset({"browse:access"})
+    with pytest.raises(TypeError):
+        first["profile"] = "ops"
+    assert _request_principal(f"Bearer {'x' * 32}", keys) == (None, True)
+
+
+def test_prebuilt_rejection_bodies_are_json(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "browse_key", "b" * 32)
+    monkeypatch.setattr(settings, "finance_key", "f" * 32)
+    test_app = FastAPI()
+    test_app.add_middleware(SecurityMiddleware)
+
+    @test_app.get("/browser/state")
+    async def state():
+        return {"ok": True}
+
+    with TestClient(test_app) as client:
+        unauthenticated = client.get("/browser/state", headers={"Authorization": "Bearer bad"})
+        forbidden = client.get("/browser/state", headers={"Authorization": f"Bearer {'f' * 32}"})
+
+    assert unauthenticated.status_code == 401
+    assert unauthenticated.headers["content-type"] == "application/json"
+    assert unauthenticated.headers["www-authenticate"] == "Bearer"
+    assert unauthenticated.json() == {"detail": "Authentication required"}
+    assert forbidden.status_code == 403
+    assert forbidden.json() == {"detail": "Profile is not allowed for this route"}
+
+
+@pytest.mark.asyncio
+async def test_declared_content_length_is_checked_from_raw_headers():
+    called = False
+
+    async def downstream(_scope, _receive, _send):
+        nonlocal called
+        called = True
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    middleware = RequestSizeLimitMiddleware(downstream, max_body_size=5)
+    for declared, expected_status in ((b"6", 413), (b"abc", 400)):
+        sent.clear()
+        scope = {
+            "type": "http",
+            "method": "POST",
+            "path": "/fetch",
+            "headers": [(b"host", b"test"), (b"content-length", declared)],
+        }
+        await middleware(scope, receive, send)
+        assert sent[0]["status"] == expected_status
+
+    assert called is False
+
+
+def test_install_cors_registers_configured_policy(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "cors_origins", ["http://localhost:3000"])
+    test_app = FastAPI()
+    install_cors(test_app)
+
+    @test_app.get("/")
+    async def root():
+        return {"ok": True}
+
+    with TestClient(test_app) as client:
+        response = client.get("/", headers={"Origin": "http://localhost:3000"})
+
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+    assert "X-Request-ID" in response.headers["access-control-expose-headers"]
+
+    with TestClient(test_app) as client:
+        response = client.get("/", headers={"Origin": "http://evil.example"})
+    assert "access-control-allow-origin" not in response.headers
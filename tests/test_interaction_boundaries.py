@@ -7,7 +7,7 @@ from fastapi import HTTPException
 
 from controllers.browser_controller import interact_with_element
 from controllers.session_controller import create_session
-from models.schemas import InteractRequest, SessionConfig, SessionCreateRequest
+from models.schemas import InteractRequest, NavigateRequest, ScrollRequest, SessionConfig, SessionCreateRequest
 from pydantic import ValidationError
 
 
@@ -68,3 +68,48 @@ def test_force_string_is_rejected_in_interaction_options():
             selector="#hidden",
             options={"force": "false"},
         )
+
+
+@pytest.mark.parametrize("session_id", ["", "session_12345678", "SESS_12345678"])
+def test_session_ids_without_prefix_are_rejected(session_id):
+    with pytest.raises(ValidationError) as exc_info:
+        InteractRequest(session_id=session_id, action="click", selector="#target")
+
+    assert exc_info.value.errors()[0]["loc"] == ("session_id",)
+
+
+def test_scroll_direction_is_normalized_and_constrained():
+    assert ScrollRequest(session_id="sess_12345678", direction="UP").direction == "up"
+    with pytest.raises(ValidationError):
+        ScrollRequest(session_id="sess_12345678", direction="left")
+
+
+def test_interaction_request_is_read_only_after_validation():
+    request = InteractRequest(
+        session_id="sess_12345678", action="type", selector="#q", value="  spaced  "
+    )
+
+    assert request.value == "  spaced  "
+    with pytest.raises(ValidationError):
+        request.selector = "#other"
+
+
+def test_navigate_url_is_limited_to_bounded_http_urls():
+    request = NavigateRequest(session_id="sess_12345678", url="https://example.com/a?q=1")
+    assert str(request.url) == "https://example.com/a?q=1"
+
+    for url in ("ftp://example.com/file", "https://", "https://example.com/" + "a" * 2048):
+        with pytest.raises(ValidationError):
+            NavigateRequest(session_id="sess_12345678", url=url)
+
+
+def test_navigate_request_accepts_readiness_spec():
+    request = NavigateRequest(
+        session_id="sess_12345678",
+        url="https://example.com/",
+        readiness={"selector": "#app", "timeout": 5000},
+    )
+
+    assert request.readiness.selector == "#app"
+    assert request.readiness.model_dump()["timeout"] == 5000
+    assert NavigateRequest(session_id="sess_12345678", url="https://example.com/").readiness is None
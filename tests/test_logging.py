@@ -0,0 +1,48 @@
+"""Structured logging queue tests."""
+import logging
+import queue
+
+import utils.logging as surf_logging
+from utils.logging import DropOldestQueueHandler, DropOldestQueueListener
+
+
+def test_log_queue_drops_oldest_record_when_full():
+    log_queue = queue.Queue(maxsize=2)
+    handler = DropOldestQueueHandler(log_queue)
+    for message in ("first", "second", "third"):
+        handler.enqueue(logging.makeLogRecord({"msg": message}))
+
+    assert [log_queue.get_nowait().msg for _ in range(2)] == ["second", "third"]
+
+
+def test_log_queue_listener_sentinel_fits_into_full_queue():
+    log_queue = queue.Queue(maxsize=1)
+    log_queue.put_nowait(logging.makeLogRecord({"msg": "pending"}))
+    listener = DropOldestQueueListener(log_queue, logging.NullHandler())
+
+    listener.enqueue_sentinel()
+
+    assert log_queue.get_nowait() is listener._sentinel
+
+
+def test_configure_logging_attaches_queue_handler_next_to_existing_handlers(monkeypatch):
+    root_logger = logging.getLogger()
+    existing = logging.NullHandler()
+    root_logger.addHandler(existing)
+    monkeypatch.setattr(surf_logging, "_queue_listener", None)
+    before = list(root_logger.handlers)
+    level = root_logger.level
+    added = []
+    try:
+        surf_logging.configure_logging("INFO")
+        added = [h for h in root_logger.handlers if h not in before]
+        assert len(added) == 1
+        assert isinstance(added[0], DropOldestQueueHandler)
+        assert existing in root_logger.handlers
+    finally:
+        if surf_logging._queue_listener is not None:
+            surf_logging._queue_listener.stop()
+        for handler in added:
+            root_logger.removeHandler(handler)
+        root_logger.removeHandler(existing)
+        root_logger.setLevel(level)
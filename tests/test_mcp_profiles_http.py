@@ -100,3 +100,11 @@ def test_route_profile_matrix_is_explicit():
     assert _route_profiles("POST", "/browser/navigate") == {"browse", "ui"}
     assert _route_profiles("POST", "/finance/macro") == {"finance"}
     assert _route_profiles("GET", "/health/metrics") == {"ops"}
+
+
+def test_route_profiles_are_shared_constants():
+    assert _route_profiles("GET", "/mcp/ui/") is _route_profiles("POST", "/mcp/ui/x")
+    assert _route_profiles("GET", "/mcp/unknown/") == {"ops"}
+    assert _route_profiles("GET", "/health/searxng") == {"web", "ops"}
+    assert _route_profiles("POST", "/health/searxng") == {"ops"}
+    assert _route_profiles("GET", "/nowhere") is _route_profiles("GET", "/health")
@@ -39,3 +39,9 @@ def test_legacy_universal_auth_is_rejected(monkeypatch):
     monkeypatch.setenv("SURF_API_TOKEN", "legacy")
     with pytest.raises(ValueError, match="legacy SURF authentication"):
         Settings(_env_file=None).validate_runtime_security()
+
+
+def test_profile_keys_have_an_upper_bound(monkeypatch):
+    _clear_legacy(monkeypatch)
+    with pytest.raises(ValueError, match="at most 512"):
+        Settings(_env_file=None, browse_key="x" * 513).validate_runtime_security()
@@ -8,7 +8,7 @@ import httpx
 import pytest
 
 from core.foundation import ResourceLimitError
-from services.search_providers import _bounded_json_request
+from services.search_providers import SearXNGSearchProvider, _bounded_json_request
 
 
 def _patch_client(transport: httpx.MockTransport):
@@ -83,3 +83,38 @@ async def test_provider_json_reader_handles_gzip_content_encoding():
             )
 
     assert result == {"results": [{"url": "https://example.com"}]}
+
+
+@pytest.mark.asyncio
+async def test_provider_reuses_pooled_client_until_closed():
+    provider = SearXNGSearchProvider()
+    client = provider._http_client()
+
+    assert provider._http_client() is client
+
+    await provider.aclose()
+    assert client.is_closed
+    reopened = provider._http_client()
+    assert reopened is not client
+    await provider.aclose()
+
+
+@pytest.mark.asyncio
+async def test_provider_json_reader_uses_supplied_client():
+    seen = []
+
+    async def handler(request):
+        seen.append(request.extensions["timeout"]["read"])
+        return httpx.Response(200, json={"results": []})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        with patch("services.search_providers.get_settings") as mocked_settings:
+            mocked_settings.return_value.max_json_parse_size = 1024
+            for _ in range(2):
+                result = await _bounded_json_request(
+                    "GET", "https://provider.example/search", timeout=3, client=client
+                )
+        assert not client.is_closed
+
+    assert result == {"results": []}
+    assert seen == [3, 3]
@@ -1,12 +1,16 @@
 """Focused tests for authenticated screenshot artifact retrieval."""
 from pathlib import Path
+from types import SimpleNamespace
 
+import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 from config import get_settings
 from controllers import artifact_controller
 from core.foundation import SecurityMiddleware, get_download_service
+from models.schemas import ScreenshotFormat, ScreenshotRequest
+from services.browser_service import BrowserService
 from services.download_service import DownloadService
 
 
@@ -45,6 +49,13 @@ def test_screenshot_artifact_contract_and_security(tmp_path, monkeypatch):
         assert response.content == screenshot.read_bytes()
         assert response.headers["content-type"] == "image/png"
         assert 'filename="page.png"' in response.headers["content-disposition"]
+        assert response.headers["cache-control"] == "private, max-age=60"
+        partial = client.get(
+            artifact["content_url"],
+            headers={"Authorization": f"Bearer {'b' * 32}", "Range": "bytes=0-3"},
+        )
+        assert partial.status_code == 206
+        assert partial.content == screenshot.read_bytes()[:4]
 
         headers = {"Authorization": f"Bearer {'b' * 32}"}
         assert client.get("/artifacts/art_unknown/content", headers=headers).status_code == 404
@@ -68,3 +79,37 @@ def test_expired_screenshot_artifact_returns_404(tmp_path, monkeypatch):
         raise AssertionError("expired artifact remained retrievable")
     except Exception as exc:
         assert "not found" in str(exc).lower()
+
+
+def test_screenshot_request_rejects_quality_for_png():
+    request = ScreenshotRequest(session_id="sess_12345678", format="jpeg", quality=80)
+    assert request.format is ScreenshotFormat.JPEG
+    with pytest.raises(ValueError):
+        ScreenshotRequest(session_id="sess_12345678", format="png", quality=80)
+    assert ScreenshotRequest(session_id="sess_12345678", quality=80).format is None
+
+
+@pytest.mark.asyncio
+async def test_jpeg_screenshot_uses_browser_encoder(tmp_path, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "screenshots_dir", str(tmp_path))
+    monkeypatch.setattr(settings, "downloads_dir", str(tmp_path / "downloads"))
+    captured = {}
+
+    class Page:
+        async def screenshot(self, **options):
+            captured.update(options)
+            Path(options["path"]).write_bytes(b"\xff\xd8jpeg")
+
+    service = BrowserService()
+    service.initialized = True
+    session = SimpleNamespace(
+        session_id="sess_12345678", page=Page(), config=SimpleNamespace(timeout=1000)
+    )
+
+    result = await service.take_screenshot(session, path="shot.png", image_format="jpeg")
+
+    assert captured["type"] == "jpeg"
+    assert "quality" not in captured
+    assert captured["path"].endswith("shot.jpg")
+    assert result["content_type"] == "image/jpeg"
@@ -0,0 +1,106 @@
+"""Profile-key resolution, verification cache and input sanitizing tests."""
+import hashlib
+
+import pytest
+
+from config import SecurityConfig, get_settings
+from config import security
+
+
+@pytest.fixture(autouse=True)
+def _clear_verified_keys():
+    """Start every test with an empty process-wide verification cache."""
+    security._verified_keys.clear()
+    yield
+    security._verified_keys.clear()
+
+
+def test_resolved_profile_key_is_cached_until_keys_change(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "browse_key", "b" * 32)
+    monkeypatch.setattr(settings, "ui_key", None)
+
+    assert SecurityConfig.resolve_profile_key("b" * 32) == "browse"
+    assert len(security._verified_keys) == 1
+
+    monkeypatch.setattr(settings, "browse_key", None)
+    monkeypatch.setattr(settings, "ui_key", "b" * 32)
+    assert SecurityConfig.resolve_profile_key("b" * 32) == "ui"
+
+
+def test_failed_profile_key_lookups_are_not_cached(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "browse_key", "b" * 32)
+
+    assert SecurityConfig.resolve_profile_key("b" * 32) == "browse"
+    cached = dict(security._verified_keys)
+
+    assert SecurityConfig.resolve_profile_key("x" * 32) is None
+    assert dict(security._verified_keys) == cached
+
+
+def test_cached_digests_are_peppered(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "browse_key", "b" * 32)
+
+    assert SecurityConfig.resolve_profile_key("b" * 32) == "browse"
+    assert hashlib.sha256(b"b" * 32).digest() not in security._verified_keys
+    assert hashlib.blake2b(b"b" * 32, digest_size=16).digest() not in security._verified_keys
+    assert security._verified_keys and all(len(digest) == 16 for digest in security._verified_keys)
+
+
+def test_profile_key_cache_can_be_disabled(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "browse_key", "b" * 32)
+    monkeypatch.setattr(settings, "ui_key", "u" * 32)
+    monkeypatch.setattr(settings, "auth_cache_max_entries", 0)
+
+    assert SecurityConfig.resolve_profile_key("b" * 32) == "browse"
+    assert len(security._verified_keys) == 0
+
+
+def test_out_of_bounds_tokens_are_rejected_before_lookup(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "browse_key", "b" * 32)
+
+    assert SecurityConfig.resolve_profile_key("b" * 31) is None
+    assert SecurityConfig.resolve_profile_key("b" * 4096) is None
+
+
+def test_sanitize_input_strips_control_characters_only():
+    raw = "  a\x00b\x1bc\td\ne\rf\x7fgé  "
+    assert SecurityConfig.sanitize_input(raw) == "abc\td\ne\rfgé"
+    assert SecurityConfig.sanitize_input("abcdef", max_length=3) == "abc"
+    assert SecurityConfig.sanitize_input("") == ""
+
+
+def test_validate_url_requires_scheme_and_host():
+    assert SecurityConfig.validate_url("https://example.com/path?q=1")
+    assert SecurityConfig.validate_url("http://127.0.0.1:8080")
+    assert not SecurityConfig.validate_url("example.com/path")
+    assert not SecurityConfig.validate_url("http:///path")
+    assert not SecurityConfig.validate_url("//example.com")
+    assert not SecurityConfig.validate_url("")
+    assert not SecurityConfig.validate_url("https://" + "a" * get_settings().max_url_length)
+
+
+def test_generated_api_keys_are_prefixed_urlsafe_and_unique():
+    keys = {SecurityConfig.generate_api_key() for _ in range(8)}
+    assert len(keys) == 8
+    for key in keys:
+        assert key.startswith("surf_")
+        assert len(key) == len("surf_") + 32
+        assert "=" not in key and "+" not in key and "/" not in key
+
+
+def test_raw_api_key_hash_matches_hex_hash():
+    raw = SecurityConfig.hash_api_key_raw("surf_example")
+    assert len(raw) == 32
+    assert raw.hex() == SecurityConfig.hash_api_key("surf_example")
+
+
+def test_non_ascii_bearer_tokens_are_rejected_not_raised(monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "browse_key", "b" * 32)
+
+    assert SecurityConfig.resolve_profile_key("é" * 32) is None
@@ -0,0 +1,29 @@
+"""Service singleton initialization tests."""
+import asyncio
+
+import pytest
+
+from core import foundation
+from services import cache_service
+
+
+@pytest.mark.asyncio
+async def test_concurrent_cold_start_initializes_service_once(monkeypatch):
+    created = []
+
+    class CountingCacheService:
+        def __init__(self):
+            created.append(self)
+            self.ready = False
+
+        async def initialize(self):
+            await asyncio.sleep(0)
+            self.ready = True
+
+    monkeypatch.setattr(foundation, "_cache_service", None)
+    monkeypatch.setattr(cache_service, "CacheService", CountingCacheService)
+
+    services = await asyncio.gather(*(foundation.get_cache_service() for _ in range(5)))
+
+    assert len(created) == 1
+    assert all(service is created[0] and service.ready for service in services)
@@ -0,0 +1,40 @@
+"""Session hard-TTL checks on the get_session hot path."""
+import time
+from datetime import timezone
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from core.foundation import InvalidSessionError
+from models.schemas import SessionStats
+from services.session_service import SessionService
+
+
+@pytest.mark.asyncio
+async def test_get_session_expires_on_float_deadline(monkeypatch):
+    service = SessionService()
+    closed = AsyncMock()
+    monkeypatch.setattr(service, "_close_session_internal", closed)
+    session = SimpleNamespace(
+        expires_at_ts=time.time() - 1, stats=SessionStats(), context=SimpleNamespace()
+    )
+    service.active_sessions["sess_12345678"] = session
+
+    with pytest.raises(InvalidSessionError):
+        await service.get_session("sess_12345678")
+    closed.assert_awaited_once_with("sess_12345678", "hard_ttl_expired")
+
+    session.expires_at_ts = time.time() + 60
+    assert await service.get_session("sess_12345678") is session
+    assert session.context.last_activity.tzinfo is timezone.utc
+
+
+@pytest.mark.asyncio
+async def test_get_session_without_deadline_never_hard_expires():
+    service = SessionService()
+    session = SimpleNamespace(expires_at_ts=None, stats=SessionStats(), context=SimpleNamespace())
+    service.active_sessions["sess_12345678"] = session
+
+    assert await service.get_session("sess_12345678", touch=False) is session
+    assert not hasattr(session.context, "last_activity")
@@ -1,10 +1,53 @@
 """Logging configuration for Surf Browser Service"""
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from typing import Optional
 import structlog
 from structlog.stdlib import LoggerFactory
 
+# Records waiting for the writer thread; beyond this the oldest are shed.
+LOG_QUEUE_SIZE = 10000
+
+_queue_listener: Optional[QueueListener] = None
+
+
+def _put_dropping_oldest(log_queue: "queue.Queue", item: Optional[logging.LogRecord]) -> None:
+    try:
+        log_queue.put_nowait(item)
+    except queue.Full:
+        try:
+            log_queue.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            log_queue.put_nowait(item)
+        except queue.Full:
+            pass
+
+
+class DropOldestQueueHandler(QueueHandler):
+    """Queue handler that sheds the oldest record rather than block the caller"""
+    
+    def enqueue(self, record: logging.LogRecord) -> None:
+        _put_dropping_oldest(self.queue, record)
+
+
+class DropOldestQueueListener(QueueListener):
+    """Queue listener whose stop sentinel still fits into a full queue"""
+    
+    def enqueue_sentinel(self) -> None:
+        _put_dropping_oldest(self.queue, self._sentinel)
+
+
+def _stop_queue_listener() -> None:
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
 
 def configure_logging(level: str = "INFO") -> None:
     """Configure structured logging with JSON output"""
@@ -27,12 +70,21 @@ def configure_logging(level: str = "INFO") -> None:
         cache_logger_on_first_use=True,
     )
     
-    # Configure standard library logging
-    logging.basicConfig(
-        level=getattr(logging, level.upper()),
-        format="%(message)s",
-        stream=sys.stdout
-    )
+    # Configure standard library logging. Records are handed to a queue and
+    # written to stdout by a listener thread, so request handlers on the event
+    # loop never block on the stream.
+    global _queue_listener
+    if _queue_listener is None:
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(logging.Formatter("%(message)s"))
+        log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        _queue_listener = DropOldestQueueListener(log_queue, stream_handler)
+        _queue_listener.start()
+        # Attached directly: basicConfig() is a no-op once anything else has
+        # given the root logger a handler, which would leave the queue unfed.
+        root_logger = logging.getLogger()
+        root_logger.setLevel(getattr(logging, level.upper()))
+        root_logger.addHandler(DropOldestQueueHandler(log_queue))
     
     # Set specific logger levels
     logging.getLogger("uvicorn").setLevel(logging.INFO)
@@ -40,51 +92,38 @@ def configure_logging(level: str = "INFO") -> None:
     logging.getLogger("playwright").setLevel(logging.WARNING)
 
 
+atexit.register(_stop_queue_listener)
+
+
 def get_logger(name: Optional[str] = None) -> structlog.BoundLogger:
     """Get a structured logger instance"""
     return structlog.get_logger(name)
 
 
+# Shared by every RequestLogger; each request only binds its own context.
+_request_logger = get_logger("request")
+
+
 class RequestLogger:
     """Request-specific logger for tracking operations"""
     
     def __init__(self, request_id: str, session_id: Optional[str] = None):
         self.request_id = request_id
         self.session_id = session_id
-        self.logger = get_logger("request")
+        self.logger = _request_logger.bind(request_id=request_id, session_id=session_id)
     
     def info(self, message: str, **kwargs) -> None:
         """Log info message with request context"""
-        self.logger.info(
-            message,
-            request_id=self.request_id,
-            session_id=self.session_id,
-            **kwargs
-        )
+        self.logger.info(message, **kwargs)
     
     def error(self, message: str, **kwargs) -> None:
         """Log error message with request context"""
-        self.logger.error(
-            message,
-            request_id=self.request_id,
-            session_id=self.session_id,
-            **kwargs
-        )
+        self.logger.error(message, **kwargs)
     
     def warning(self, message: str, **kwargs) -> None:
         """Log warning message with request context"""
-        self.logger.warning(
-            message,
-            request_id=self.request_id,
-            session_id=self.session_id,
-            **kwargs
-        )
+        self.logger.warning(message, **kwargs)
     
     def debug(self, message: str, **kwargs) -> None:
         """Log debug message with request context"""
-        self.logger.debug(
-            message,
-            request_id=self.request_id,
-            session_id=self.session_id,
-            **kwargs
-        )
+        self.logger.debug(message, **kwargs)
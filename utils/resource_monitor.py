@@ -114,7 +114,6 @@ class ResourceMonitor:
         """Calculate maximum sessions based on system resources"""
         try:
             available_ram = psutil.virtual_memory().available / (1024**3)  # GB
-            cpu_count = psutil.cpu_count()
             
             # Conservative calculation: 2 sessions per GB RAM, max 20
             max_sessions = max(5, min(20, int(available_ram * 2)))